@@ -20,6 +20,54 @@ class Settings(BaseSettings):
     # LLM Configuration (for future use)
     openai_api_key: Optional[str] = None
     groq_api_key: Optional[str] = None
+    llm_provider: str = "groq"  # groq or mock (local, no network)
+    mock_llm_latency_ms: int = 200  # Simulated LLM latency for the mock provider
+    mock_llm_spike_probability: float = 0.0  # Chance a mock call hits a latency spike
+    mock_llm_spike_ms: int = 2000  # Extra latency added by a spike
+    mock_llm_capacity: int = 0  # Concurrent calls before mock latency degrades (0 = unlimited)
+    
+    # Twilio dry run: log outgoing messages instead of sending them
+    twilio_dry_run: bool = False
+    
+    # Deployment Configuration
+    workers: int = 1  # Number of uvicorn worker processes
+    
+    # Shared State Configuration (verdict cache, dedup, rate limits)
+    state_backend: str = "sqlite"  # memory, sqlite or redis
+    state_db_path: str = "myth_buster_state.db"
+    state_db_timeout: float = 0.25  # Seconds to wait for a locked SQLite database before failing open
+    redis_url: Optional[str] = None  # e.g. redis://localhost:6379/0
+    verdict_cache_ttl: int = 86400  # Seconds to keep a fact-check verdict
+    dedup_ttl: int = 3600  # Seconds to remember a processed MessageSid
+    rate_limit_per_minute: int = 20  # Messages per sender per minute
+    
+    # Myth Knowledge Base Configuration
+    myth_kb_index_path: str = "data/myths.idx"  # Built with: python -m app.myth_index data/myths.jsonl data/myths.idx
+    myth_kb_min_similarity: float = 0.8  # Trigram similarity for fuzzy matches
+    myth_kb_reload_interval: float = 5.0  # Seconds between checks for a rebuilt index
+    
+    # Language Configuration
+    langid_corpus_path: str = "data/langid.jsonl"  # Labelled text the language identifier is trained on
+    
+    # Scheduling Configuration (per worker process)
+    llm_max_concurrency: int = 8  # Upper bound on concurrent LLM fact-checks
+    llm_min_concurrency: int = 2  # Lower bound (and starting point) of the adaptive limit
+    llm_adaptive_concurrency: bool = True  # Adapt the limit to observed LLM latency (AIMD)
+    llm_latency_tolerance: float = 2.0  # Latency above baseline * tolerance counts as congestion
+    cache_max_concurrency: int = 64  # Concurrent verdict cache lookups
+    llm_deadline_seconds: float = 10.0  # Max queue wait before a fact-check is degraded
+    
+    # Overload Configuration (when the LLM lane has a backlog)
+    llm_defer_queue_depth: int = 16  # Queued fact-checks beyond which new ones are acknowledged and deferred
+    deferred_deadline_seconds: float = 120.0  # Max queue wait for a deferred answer before it is shed
+    
+    # Observability Configuration
+    tracing_enabled: bool = False  # Record per-request trace spans
+    trace_export_path: Optional[str] = "traces.jsonl"  # OTLP/JSON lines file (None to disable)
+    trace_collector_url: Optional[str] = None  # OTLP/HTTP endpoint, e.g. http://localhost:4318/v1/traces
+    trace_sample_rate: float = 1.0  # Fraction of requests traced
+    admin_token: Optional[str] = None  # Enables /admin endpoints (sent as X-Admin-Token)
+    profile_max_seconds: float = 60.0  # Longest allowed sampling profile
     
     # Application Configuration
     debug: bool = False
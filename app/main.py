@@ -6,8 +6,9 @@ Main FastAPI application
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.responses import PlainTextResponse
 import logging
-from app.routes import webhook
+from app.routes import webhook, admin
 from app.config import settings
+from app.services.tracing import TracingMiddleware
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -20,8 +21,12 @@ app = FastAPI(
     version="1.0.0"
 )
 
-# Include webhook routes
+# Trace each request end to end (no-op unless TRACING_ENABLED)
+app.add_middleware(TracingMiddleware)
+
+# Include webhook and admin routes
 app.include_router(webhook.router)
+app.include_router(admin.router)
 
 @app.get("/")
 async def root():
@@ -35,4 +40,10 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    if settings.workers > 1:
+        # Multi-worker mode: each worker is a separate process sharing state via the state store
+        if settings.state_backend == "memory":
+            logger.warning("STATE_BACKEND=memory does not share state between workers")
+        uvicorn.run("app.main:app", host="0.0.0.0", port=8000, workers=settings.workers)
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=8000)
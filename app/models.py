@@ -1,7 +1,12 @@
 """
 Data models for AI Myth-Buster WhatsApp Bot
+
+Incoming data is validated once, at the edge (WhatsAppMessage in the
+webhook). Everything built inside the app from already-validated data is
+a plain slotted dataclass, so the hot path does no further validation.
 """
 
+from dataclasses import dataclass, field
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
 from datetime import datetime
@@ -35,17 +40,20 @@ class WhatsAppMessage(BaseModel):
         return int(self.NumMedia or "0") > 0
 
 
-class FactCheckRequest(BaseModel):
-    """Model for fact-check request"""
+@dataclass(slots=True)
+class FactCheckRequest:
+    """Fact-check request (internal, built from a validated WhatsAppMessage)"""
     
     message: str
     sender: str
     message_id: str
-    timestamp: datetime = datetime.now()
+    language: str = "en"  # Language code from app.language_id
+    timestamp: datetime = field(default_factory=datetime.now)  # Evaluated per request
 
 
-class FactCheckResponse(BaseModel):
-    """Model for fact-check response"""
+@dataclass(slots=True)
+class FactCheckResponse:
+    """Fact-check response (internal)"""
     
     original_message: str
     fact_check_result: str
@@ -54,8 +62,9 @@ class FactCheckResponse(BaseModel):
     is_safe_to_process: bool = True
     
     
-class BotResponse(BaseModel):
-    """Model for bot response message"""
+@dataclass(slots=True)
+class BotResponse:
+    """Bot response message (internal)"""
     
     to: str  # Recipient WhatsApp number
     message: str
@@ -0,0 +1,263 @@
+"""
+Myth knowledge base index for AI Myth-Buster Bot
+
+Compiles the curated myth file (data/myths.jsonl) into a binary index that
+is memory-mapped at runtime. Opening an index only reads its header, so
+startup cost does not grow with the size of the knowledge base, and
+lookups decode just the records they touch.
+
+Index layout (little-endian):
+
+    header    magic (with format version), counts and section offsets
+    entries   (record_id u32, trigram_count u32, negations u32, numbers u32) per claim or alias
+    keys      (hash u64, entry_id u32) sorted by hash
+    records   (blob_offset u32, blob_length u32) per myth
+    trigrams  (trigram_hash u32, postings_start u32, postings_count u32) sorted by hash
+    postings  entry_id u32
+    blob      UTF-8 JSON of each myth's verdict, explanation and sources
+
+Build the index with:
+
+    python -m app.myth_index data/myths.jsonl data/myths.idx
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import zlib
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+MAGIC = b"MYTHKB03"
+HEADER = struct.Struct("<8s6I")  # magic + entry, key, record, trigram, posting and blob-byte counts
+OFFSETS = struct.Struct("<6Q")  # Offset of each section
+ENTRY = struct.Struct("<IIII")
+KEY = struct.Struct("<QI")
+RECORD = struct.Struct("<II")
+TRIGRAM = struct.Struct("<III")
+POSTING = struct.Struct("<I")
+
+# Devanagari and Arabic-script vowel signs are not \w but belong to words
+_MARKS = "\u0900-\u0903\u093a-\u094f\u0951-\u0957\u0962\u0963\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06dc\u06df-\u06e4\u06e7\u06e8\u06ea-\u06ed"
+_PUNCTUATION = re.compile(rf"[^\w\s{_MARKS}]")
+_WHITESPACE = re.compile(r"\s+")
+
+# Words that flip a claim. "don't" normalizes to "don t", so a lone "t" is "not".
+# Each word is one bit of an entry's negation mask; rebuild indexes after changing this.
+NEGATIONS = ("not", "no", "never", "nor", "neither", "none", "nothing", "nobody", "cannot", "without")
+_NEGATION_BITS = {word: 1 << bit for bit, word in enumerate(NEGATIONS)}
+_NEGATION_BITS["t"] = _NEGATION_BITS["not"]
+
+
+def normalize_claim(text: str) -> str:
+    """Lowercase a claim and strip punctuation and extra whitespace"""
+    text = _PUNCTUATION.sub(" ", text.lower())
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def key_hash(normalized: str) -> int:
+    """64-bit hash of a normalized claim"""
+    return int.from_bytes(hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def claim_trigrams(normalized: str) -> Set[int]:
+    """Hashed character trigrams of a normalized claim"""
+    padded = f" {normalized} "
+    return {zlib.crc32(padded[i:i + 3].encode("utf-8")) for i in range(len(padded) - 2)}
+
+
+def negation_mask(normalized: str) -> int:
+    """Bit mask of the negation words in a normalized claim"""
+    mask = 0
+    for word in normalized.split():
+        mask |= _NEGATION_BITS.get(word, 0)
+    return mask
+
+
+def number_hash(normalized: str) -> int:
+    """Hash of the set of numbers in a normalized claim (0 without numbers)"""
+    numbers = sorted({word for word in normalized.split() if word.isdigit()})
+    return zlib.crc32(" ".join(numbers).encode("utf-8")) if numbers else 0
+
+
+def compile_index(source_path: str, index_path: str, trigrams: bool = True) -> int:
+    """
+    Compile a myths JSONL file into a binary index
+
+    The index is written to a temporary file and atomically renamed, so
+    running workers pick up either the old or the new index, never a
+    partial one.
+
+    Args:
+        source_path: JSONL file with claim, aliases, verdict, explanation, sources
+        index_path: Destination index file
+        trigrams: Include the trigram index used for fuzzy matching
+
+    Returns:
+        int: Number of myths compiled
+    """
+    entries: List[Tuple[int, int, int]] = []
+    keys: Dict[int, int] = {}
+    postings: Dict[int, List[int]] = defaultdict(list)
+    blob = bytearray()
+    records: List[Tuple[int, int]] = []
+
+    with open(source_path, encoding="utf-8") as f:
+        myths = [json.loads(line) for line in f if line.strip()]
+
+    for record_id, myth in enumerate(myths):
+        payload = json.dumps({
+            "claim": myth["claim"],
+            "verdict": myth["verdict"],
+            "explanation": myth["explanation"],
+            "sources": myth.get("sources", []),
+        }, ensure_ascii=False).encode("utf-8")
+        records.append((len(blob), len(payload)))
+        blob += payload
+
+        for text in [myth["claim"], *myth.get("aliases", [])]:
+            normalized = normalize_claim(text)
+            hashed = key_hash(normalized)
+            if hashed in keys:
+                continue  # Duplicate alias: first myth wins
+            entry_id = len(entries)
+            grams = claim_trigrams(normalized) if trigrams else set()
+            entries.append((record_id, len(grams), negation_mask(normalized), number_hash(normalized)))
+            keys[hashed] = entry_id
+            for gram in grams:
+                postings[gram].append(entry_id)
+
+    sections = [
+        b"".join(ENTRY.pack(*entry) for entry in entries),
+        b"".join(KEY.pack(hashed, entry_id) for hashed, entry_id in sorted(keys.items())),
+        b"".join(RECORD.pack(*record) for record in records),
+    ]
+    trigram_table = bytearray()
+    posting_table = bytearray()
+    for gram in sorted(postings):
+        trigram_table += TRIGRAM.pack(gram, len(posting_table) // POSTING.size, len(postings[gram]))
+        for entry_id in postings[gram]:
+            posting_table += POSTING.pack(entry_id)
+    sections += [bytes(trigram_table), bytes(posting_table), bytes(blob)]
+
+    offsets = []
+    position = HEADER.size + OFFSETS.size
+    for section in sections:
+        offsets.append(position)
+        position += len(section)
+
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(entries), len(keys), len(records), len(postings),
+                            len(posting_table) // POSTING.size, len(blob)))
+        f.write(OFFSETS.pack(*offsets))
+        for section in sections:
+            f.write(section)
+    os.replace(tmp_path, index_path)
+    return len(records)
+
+
+class MythIndex:
+    """Read-only, memory-mapped view of a compiled myth index"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.n_entries, self.n_keys, self.n_records, self.n_trigrams, _, _ = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a myth index")
+        (self._entries, self._keys, self._records,
+         self._trigrams, self._postings, self._blob) = OFFSETS.unpack_from(self._mm, HEADER.size)
+
+    def __len__(self) -> int:
+        return self.n_records
+
+    def _record(self, entry_id: int) -> Dict[str, Any]:
+        record_id, _, _, _ = ENTRY.unpack_from(self._mm, self._entries + entry_id * ENTRY.size)
+        offset, length = RECORD.unpack_from(self._mm, self._records + record_id * RECORD.size)
+        start = self._blob + offset
+        return json.loads(self._mm[start:start + length].decode("utf-8"))
+
+    def _search(self, table: int, item: struct.Struct, count: int, target: int) -> Optional[int]:
+        """Binary search a table sorted by its first field; returns the row index"""
+        low, high = 0, count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            value = item.unpack_from(self._mm, table + middle * item.size)[0]
+            if value == target:
+                return middle
+            if value < target:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return None
+
+    def lookup(self, claim: str) -> Optional[Dict[str, Any]]:
+        """
+        Exact lookup of a claim (after normalization)
+
+        Returns:
+            Optional[Dict[str, Any]]: The myth record, or None
+        """
+        row = self._search(self._keys, KEY, self.n_keys, key_hash(normalize_claim(claim)))
+        if row is None:
+            return None
+        _, entry_id = KEY.unpack_from(self._mm, self._keys + row * KEY.size)
+        return self._record(entry_id)
+
+    def similar(self, claim: str, min_similarity: float) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Fuzzy lookup using the trigram index (Dice coefficient)
+
+        "The Earth is not flat" shares most trigrams with "The Earth is
+        flat" but says the opposite, and "Drink 2 glasses of water daily"
+        is not the 8-glasses myth, so the best match only counts if it has
+        the same negation words and numbers as the claim.
+
+        Returns:
+            Optional[Tuple[Dict[str, Any], float]]: Best myth record and its
+                similarity, or None if nothing reaches min_similarity or
+                the best match differs in negation or numbers
+        """
+        if not self.n_trigrams:
+            return None
+        normalized = normalize_claim(claim)
+        grams = claim_trigrams(normalized)
+        overlap: Counter = Counter()
+        for gram in grams:
+            row = self._search(self._trigrams, TRIGRAM, self.n_trigrams, gram)
+            if row is None:
+                continue
+            _, start, count = TRIGRAM.unpack_from(self._mm, self._trigrams + row * TRIGRAM.size)
+            base = self._postings + start * POSTING.size
+            for i in range(count):
+                overlap[POSTING.unpack_from(self._mm, base + i * POSTING.size)[0]] += 1
+
+        best_entry, best_score = None, 0.0
+        for entry_id, shared in overlap.items():
+            _, entry_grams, _, _ = ENTRY.unpack_from(self._mm, self._entries + entry_id * ENTRY.size)
+            score = 2 * shared / (len(grams) + entry_grams)
+            if score > best_score:
+                best_entry, best_score = entry_id, score
+        if best_entry is None or best_score < min_similarity:
+            return None
+        _, _, negations, numbers = ENTRY.unpack_from(self._mm, self._entries + best_entry * ENTRY.size)
+        if negations != negation_mask(normalized) or numbers != number_hash(normalized):
+            return None
+        return self._record(best_entry), best_score
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4) or (len(sys.argv) == 4 and sys.argv[3] != "--no-trigrams"):
+        print("Usage: python -m app.myth_index SOURCE.jsonl INDEX.idx [--no-trigrams]")
+        sys.exit(1)
+    count = compile_index(sys.argv[1], sys.argv[2], trigrams=len(sys.argv) == 3)
+    print(f"Compiled {count} myths into {sys.argv[2]}")
@@ -0,0 +1,59 @@
+"""
+Admin routes for AI Myth-Buster WhatsApp Bot
+
+Disabled unless ADMIN_TOKEN is set; requests must send it in the
+X-Admin-Token header.
+"""
+
+import asyncio
+import logging
+import os
+import secrets
+from fastapi import APIRouter, HTTPException, Header, Query
+from fastapi.responses import PlainTextResponse
+from typing import Optional
+from app.config import settings
+from app.services.profiler import profiler
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+def _check_admin_token(token: Optional[str]) -> None:
+    """Reject the request unless admin endpoints are enabled and the token matches"""
+    if not settings.admin_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not token or not secrets.compare_digest(token, settings.admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+@router.get("/profile")
+async def profile(
+    seconds: float = Query(5.0, gt=0),
+    interval_ms: float = Query(5.0, ge=1),
+    thread: Optional[str] = Query(None, description="Only sample threads whose name starts with this"),
+    x_admin_token: Optional[str] = Header(None, alias="X-Admin-Token")
+):
+    """
+    Run a time-bounded sampling profile of the worker serving this request
+
+    Returns collapsed stacks ("frame;frame;frame count" per line), ready
+    for flamegraph.pl, speedscope or inferno. The X-Worker-Pid response
+    header identifies the worker that was profiled.
+    """
+    _check_admin_token(x_admin_token)
+    if seconds > settings.profile_max_seconds:
+        raise HTTPException(status_code=400, detail=f"seconds must be at most {settings.profile_max_seconds}")
+    if profiler.busy:
+        raise HTTPException(status_code=409, detail="A profile is already running in this worker")
+
+    logger.info(f"Profiling worker {os.getpid()} for {seconds}s")
+
+    # Sample from a separate thread so the event loop keeps serving traffic
+    try:
+        stacks = await asyncio.to_thread(profiler.profile, seconds, interval_ms / 1000, thread)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    return PlainTextResponse(stacks, headers={"X-Worker-Pid": str(os.getpid())})
@@ -3,46 +3,71 @@ Webhook routes for AI Myth-Buster WhatsApp Bot
 """
 
 import logging
-from fastapi import APIRouter, Request, HTTPException, Form, Header
+import os
+from fastapi import APIRouter, Request, HTTPException, Header
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import PlainTextResponse
+from pydantic import ValidationError
 from typing import Optional
 from app.models import WhatsAppMessage
 from app.services.twilio_service import twilio_service
 from app.services.message_service import message_service
+from app.services.concurrency import llm_limiter
+from app.services.scheduler import scheduler
+from app.services.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/webhook", tags=["webhook"])
 
 
-@router.post("/whatsapp")
+def _body_errors(error: ValidationError) -> list:
+    """
+    Validation errors in the shape FastAPI reports for Form parameters
+
+    Locations get the "body" prefix, and a missing field's input is None
+    rather than the whole form.
+    """
+    return [
+        {**err, "loc": ("body", *err["loc"]), "input": None if err["type"] == "missing" else err["input"]}
+        for err in error.errors()
+    ]
+
+
+@router.post(
+    "/whatsapp",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-www-form-urlencoded": {"schema": WhatsAppMessage.model_json_schema()}}
+        }
+    }
+)
+@tracer.traced("whatsapp_webhook")
 async def whatsapp_webhook(
     request: Request,
-    MessageSid: str = Form(...),
-    AccountSid: str = Form(...),
-    From: str = Form(...),
-    To: str = Form(...),
-    Body: str = Form(...),
-    NumMedia: Optional[str] = Form("0"),
-    MediaUrl0: Optional[str] = Form(None),
-    MediaContentType0: Optional[str] = Form(None),
-    ProfileName: Optional[str] = Form(None),
-    WaId: Optional[str] = Form(None),
     x_twilio_signature: Optional[str] = Header(None, alias="X-Twilio-Signature")
 ):
     """
     Webhook endpoint for receiving WhatsApp messages from Twilio
     
     This endpoint receives POST requests from Twilio when a WhatsApp message
-    is sent to your bot number.
+    is sent to your bot number. The form is validated once, directly into a
+    WhatsAppMessage; everything downstream trusts that object.
     """
+    form_data = await request.form()
+    try:
+        with tracer.span("model.WhatsAppMessage"):
+            whatsapp_message = WhatsAppMessage.model_validate(dict(form_data))
+    except ValidationError as e:
+        raise RequestValidationError(_body_errors(e))
+    
     try:
-        logger.info(f"Received webhook from {From}: {Body}")
+        logger.info(f"Received webhook from {whatsapp_message.From}: {whatsapp_message.Body}")
         
         # Optional: Validate Twilio signature for security
         # Uncomment the following lines in production
         # if x_twilio_signature:
-        #     form_data = await request.form()
         #     url = str(request.url)
         #     if not twilio_service.validate_webhook_signature(
         #         x_twilio_signature, url, dict(form_data)
@@ -50,19 +75,10 @@ async def whatsapp_webhook(
         #         logger.warning("Invalid Twilio signature")
         #         raise HTTPException(status_code=403, detail="Invalid signature")
         
-        # Create WhatsApp message object
-        whatsapp_message = WhatsAppMessage(
-            MessageSid=MessageSid,
-            AccountSid=AccountSid,
-            From=From,
-            To=To,
-            Body=Body,
-            NumMedia=NumMedia,
-            MediaUrl0=MediaUrl0,
-            MediaContentType0=MediaContentType0,
-            ProfileName=ProfileName,
-            WaId=WaId
-        )
+        # Skip Twilio retries of a message any worker has already handled
+        if await message_service.is_duplicate(whatsapp_message.MessageSid):
+            logger.info(f"Ignoring duplicate delivery of {whatsapp_message.MessageSid}")
+            return PlainTextResponse("", status_code=200)
         
         # Process the message and generate response
         bot_response = await message_service.process_incoming_message(whatsapp_message)
@@ -71,9 +87,9 @@ async def whatsapp_webhook(
         success = await twilio_service.send_bot_response(bot_response)
         
         if success:
-            logger.info(f"Successfully sent response to {From}")
+            logger.info(f"Successfully sent response to {whatsapp_message.From}")
         else:
-            logger.error(f"Failed to send response to {From}")
+            logger.error(f"Failed to send response to {whatsapp_message.From}")
         
         # Return empty response to Twilio (required)
         return PlainTextResponse("", status_code=200)
@@ -84,7 +100,7 @@ async def whatsapp_webhook(
         # Try to send error message to user
         try:
             error_response = f"Sorry, I encountered an error. Please try again later."
-            await twilio_service.send_message(From, error_response)
+            await twilio_service.send_message(whatsapp_message.From, error_response)
         except:
             pass  # Don't fail if we can't send error message
         
@@ -104,12 +120,18 @@ async def whatsapp_webhook_verification():
 async def webhook_status():
     """
     Status endpoint to check if webhook service is running
+    
+    Includes per-lane queue-wait and service-time latency and the adaptive
+    LLM concurrency limit for this worker.
     """
     return {
         "status": "active",
         "service": "whatsapp-webhook",
+        "worker_pid": os.getpid(),
         "endpoints": {
             "webhook": "/webhook/whatsapp",
             "status": "/webhook/status"
-        }
+        },
+        "lanes": scheduler.stats(),
+        "llm_limiter": llm_limiter.snapshot()
     }
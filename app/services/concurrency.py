@@ -0,0 +1,130 @@
+"""
+Adaptive concurrency limiting for AI Myth-Buster Bot
+
+AIMD limiter driven by observed LLM latency: the limit grows by one slot
+per round of healthy calls and is cut multiplicatively when the median of
+recent latencies rises well above the no-load baseline or a call fails.
+Using the median keeps isolated latency spikes from collapsing the limit;
+sustained queueing at the provider still does. The LLM lane of the scheduler uses
+the current limit as its concurrency cap.
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Additive-increase / multiplicative-decrease concurrency limit"""
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        tolerance: float = 2.0,
+        backoff: float = 0.75,
+        baseline_drift: float = 0.01,
+        window: int = 20,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            initial_limit: Starting limit
+            min_limit: The limit never drops below this
+            max_limit: The limit never grows above this
+            tolerance: Latency above baseline * tolerance counts as congestion
+            backoff: Factor applied to the limit on congestion
+            baseline_drift: How fast the baseline follows slower latencies
+                while the limit is at its floor
+            window: Number of recent samples whose median is compared to the baseline
+            enabled: When False the limit stays at max_limit
+            clock: Monotonic time source, in seconds
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.baseline_drift = baseline_drift
+        self.recent = deque(maxlen=window)
+        self.enabled = enabled
+        self.clock = clock
+        self._limit = float(initial_limit if enabled else max_limit)
+        self.baseline: Optional[float] = None
+        self._last_decrease = 0.0
+
+    @property
+    def recent_latency(self) -> Optional[float]:
+        """Median of the recent latency window"""
+        if not self.recent:
+            return None
+        return sorted(self.recent)[len(self.recent) // 2]
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit"""
+        return int(self._limit)
+
+    def record(self, latency: float, success: bool = True) -> None:
+        """
+        Feed one completed call into the limiter
+
+        Args:
+            latency: Call latency in seconds
+            success: False if the call errored or timed out
+        """
+        if not self.enabled:
+            return
+
+        if success:
+            self.recent.append(latency)
+            # Baseline tracks the fastest recent latency. It only drifts up
+            # while the limit is at its floor: latency that stays high even
+            # then means the provider itself got slower, not that we overload it
+            if self.baseline is None or latency < self.baseline:
+                self.baseline = latency
+            elif self.limit <= self.min_limit:
+                self.baseline += self.baseline_drift * (latency - self.baseline)
+
+        recent = self.recent_latency
+        congested = len(self.recent) * 2 >= self.recent.maxlen and recent > self.baseline * self.tolerance
+        if not success or congested:
+            now = self.clock()
+            # Decrease at most once per round trip, so the slow calls that
+            # were all in flight together only count once
+            if now - self._last_decrease >= (recent or 0.0):
+                previous = self.limit
+                self._limit = max(float(self.min_limit), self._limit * self.backoff)
+                self._last_decrease = now
+                # Judge the new limit on fresh samples only
+                self.recent.clear()
+                if self.limit != previous:
+                    logger.warning(f"LLM congestion ({(recent or latency) * 1000:.0f} ms median): concurrency limit {previous} -> {self.limit}")
+        else:
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current limit and latency baseline"""
+        return {
+            "enabled": self.enabled,
+            "limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "baseline_ms": round(self.baseline * 1000, 2) if self.baseline is not None else None,
+            "recent_p50_ms": round(self.recent_latency * 1000, 2) if self.recent else None,
+        }
+
+
+# Global limiter for LLM calls
+llm_limiter = AdaptiveConcurrencyLimiter(
+    initial_limit=settings.llm_min_concurrency,
+    min_limit=settings.llm_min_concurrency,
+    max_limit=settings.llm_max_concurrency,
+    tolerance=settings.llm_latency_tolerance,
+    enabled=settings.llm_adaptive_concurrency
+)
@@ -2,10 +2,20 @@
 AI Fact-checking service using Groq API for AI Myth-Buster Bot
 """
 
+import asyncio
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from groq import Groq
 from app.config import settings
+from app.language_id import ENGLISH
+from app.myth_index import normalize_claim
 from app.models import FactCheckRequest, FactCheckResponse
+from app.services.concurrency import llm_limiter
+from app.services.localization import contains_any, get_locale
+from app.services.mock_llm import MockGroqClient
+from app.services.tracing import tracer, SPAN_KIND_CLIENT
 
 logger = logging.getLogger(__name__)
 
@@ -14,15 +24,28 @@ class FactCheckService:
     """Service for AI-powered fact-checking using Groq"""
     
     def __init__(self):
-        """Initialize Groq client"""
+        """Initialize Groq client (or the local mock provider)"""
         try:
-            self.client = Groq(api_key=settings.groq_api_key)
+            if settings.llm_provider == "mock":
+                self.client = MockGroqClient(
+                    latency_ms=settings.mock_llm_latency_ms,
+                    spike_probability=settings.mock_llm_spike_probability,
+                    spike_ms=settings.mock_llm_spike_ms,
+                    capacity=settings.mock_llm_capacity
+                )
+            else:
+                self.client = Groq(api_key=settings.groq_api_key)
             self.model = "llama-3.1-8b-instant"  # Fast and accurate model
-            logger.info("Groq fact-checking service initialized successfully")
+            # Dedicated threads for the blocking client, one per LLM lane slot
+            self.executor = ThreadPoolExecutor(
+                max_workers=settings.llm_max_concurrency, thread_name_prefix="llm"
+            )
+            logger.info(f"Fact-checking service initialized successfully (provider: {settings.llm_provider})")
         except Exception as e:
             logger.error(f"Failed to initialize Groq client: {e}")
             raise
     
+    @tracer.traced("fact_check_claim")
     async def fact_check_claim(self, request: FactCheckRequest) -> FactCheckResponse:
         """
         Fact-check a claim using Groq AI
@@ -35,25 +58,16 @@ class FactCheckService:
         """
         try:
             # Create a comprehensive fact-checking prompt
-            prompt = self._create_fact_check_prompt(request.message)
+            prompt = self._create_fact_check_prompt(request.message, request.language)
             
-            # Call Groq API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert fact-checker. Analyze claims objectively, provide evidence-based responses, and cite reliable sources when possible. Be concise but thorough."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.1,  # Low temperature for factual accuracy
-                max_tokens=500,   # Reasonable length for WhatsApp
-                top_p=0.9
-            )
+            # Call Groq API, feeding its latency to the adaptive concurrency limiter
+            started = time.monotonic()
+            try:
+                response = await self._complete(prompt)
+            except Exception:
+                llm_limiter.record(time.monotonic() - started, success=False)
+                raise
+            llm_limiter.record(time.monotonic() - started)
             
             fact_check_result = response.choices[0].message.content.strip()
             
@@ -65,13 +79,14 @@ class FactCheckService:
             
             logger.info(f"Fact-check completed for message from {request.sender}")
             
-            return FactCheckResponse(
-                original_message=request.message,
-                fact_check_result=fact_check_result,
-                confidence_score=confidence_score,
-                sources=sources,
-                is_safe_to_process=True
-            )
+            with tracer.span("model.FactCheckResponse"):
+                return FactCheckResponse(
+                    original_message=request.message,
+                    fact_check_result=fact_check_result,
+                    confidence_score=confidence_score,
+                    sources=sources,
+                    is_safe_to_process=True
+                )
             
         except Exception as e:
             logger.error(f"Error during fact-checking: {e}")
@@ -85,8 +100,37 @@ class FactCheckService:
                 is_safe_to_process=True
             )
     
-    def _create_fact_check_prompt(self, message: str) -> str:
-        """Create an effective fact-checking prompt"""
+    @tracer.traced("llm.chat_completion", SPAN_KIND_CLIENT)
+    async def _complete(self, prompt: str):
+        """Run the blocking chat completion on the LLM thread pool"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, partial(
+            self.client.chat.completions.create,
+            model=self.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are an expert fact-checker. Analyze claims objectively, provide evidence-based responses, and cite reliable sources when possible. Be concise but thorough."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.1,  # Low temperature for factual accuracy
+            max_tokens=500,   # Reasonable length for WhatsApp
+            top_p=0.9
+        ))
+    
+    def _create_fact_check_prompt(self, message: str, language: str = ENGLISH) -> str:
+        """Create an effective fact-checking prompt, answered in the language of the claim"""
+        if language == ENGLISH:
+            reply_language = ""
+        else:
+            # The verdict label stays in English so _calculate_confidence can read it
+            reply_language = f"""
+Write your response in {get_locale(language).llm_language}, but start it with the
+verdict label in English (TRUE, FALSE, PARTIALLY TRUE or UNVERIFIABLE).
+"""
         return f"""
 Please fact-check the following claim:
 
@@ -99,7 +143,7 @@ Provide a clear, concise response that includes:
 
 Keep your response under 400 characters for WhatsApp readability.
 Be objective and evidence-based.
-"""
+{reply_language}"""
     
     def _calculate_confidence(self, response: str) -> float:
         """Calculate confidence score based on response content"""
@@ -135,40 +179,28 @@ Be objective and evidence-based.
         
         return sources
     
-    def is_fact_checkable(self, message: str) -> bool:
+    @tracer.traced("classify")
+    def is_fact_checkable(self, message: str, language: str = ENGLISH) -> bool:
         """
         Determine if a message contains fact-checkable content
         
         Args:
             message: Message content to analyze
+            language: Language code of the message (selects the keyword lists)
             
         Returns:
             bool: True if message appears to contain factual claims
         """
-        message_lower = message.lower()
-        
-        # Indicators of factual claims
-        fact_indicators = [
-            "is", "are", "was", "were", "will", "can", "cannot", "causes", "prevents",
-            "study shows", "research", "scientists", "doctors", "experts", "proven",
-            "fact", "true", "false", "according to", "statistics", "data"
-        ]
-        
-        # Personal conversation indicators (skip these)
-        personal_indicators = [
-            "how are you", "what's up", "hello", "hi", "hey", "thanks", "thank you",
-            "good morning", "good evening", "good night", "love you", "miss you"
-        ]
+        locale = get_locale(language)
+        normalized = normalize_claim(message)
         
-        # Check for personal conversation first
-        for indicator in personal_indicators:
-            if indicator in message_lower:
-                return False
+        # Check for personal conversation first (skip these)
+        if contains_any(normalized, locale.personal_indicators):
+            return False
         
-        # Check for fact-checkable content
-        for indicator in fact_indicators:
-            if indicator in message_lower:
-                return True
+        # Check for indicators of factual claims
+        if contains_any(normalized, locale.fact_indicators):
+            return True
         
         # If message is substantial (>20 chars) and not clearly personal, allow fact-checking
         return len(message.strip()) > 20
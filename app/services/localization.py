@@ -0,0 +1,298 @@
+"""
+Localization for AI Myth-Buster Bot
+
+Per-language keyword lists for the greeting/claim classifiers, canned
+conversational and system replies (rate limit, overload, errors) and the
+language the LLM should answer in. The
+language of each message is identified locally (see app/language_id.py).
+
+Keywords are matched as whole words or phrases on normalized text, so
+"hi" matches "hi there" but not "this".
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, Tuple
+from app.config import settings
+from app.language_id import LanguageIdentifier, ENGLISH, SPANISH, HINDI, URDU, ROMAN_HINDI
+from app.myth_index import normalize_claim
+from app.services.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class Locale:
+    """Classifier keywords and replies for one language"""
+
+    code: str
+    llm_language: str  # How the fact-check prompt names the reply language
+    greetings: Tuple[str, ...]
+    thanks: Tuple[str, ...]
+    help_words: Tuple[str, ...]
+    personal_indicators: Tuple[str, ...]  # Chat that is never fact-checked
+    fact_indicators: Tuple[str, ...]
+    greeting_reply: str
+    thanks_reply: str
+    help_reply: str
+    default_reply: str
+    rate_limit_reply: str
+    media_reply: str  # Formatted with the message body as {body}
+    deferred_reply: str  # Acknowledgement when a fact-check is deferred
+    overloaded_reply: str  # A fact-check that could not start before its deadline
+    shed_reply: str  # A deferred fact-check that could not start before its deadline
+    error_reply: str
+
+    def __post_init__(self):
+        # Match keywords in the same normalized form as the messages
+        for name in ("greetings", "thanks", "help_words", "personal_indicators", "fact_indicators"):
+            setattr(self, name, tuple(normalize_claim(phrase) for phrase in getattr(self, name)))
+
+
+def contains_any(normalized: str, phrases: Tuple[str, ...]) -> bool:
+    """True if any phrase occurs as whole words in a normalized message"""
+    padded = f" {normalized} "
+    return any(f" {phrase} " in padded for phrase in phrases)
+
+
+LOCALES: Dict[str, Locale] = {
+    ENGLISH: Locale(
+        code=ENGLISH,
+        llm_language="English",
+        greetings=("hello", "hi", "hey", "good morning", "good evening"),
+        thanks=("thank", "thanks", "thank you"),
+        help_words=("help", "how", "what can you do"),
+        personal_indicators=(
+            "how are you", "what's up", "hello", "hi", "hey", "thanks", "thank you",
+            "good morning", "good evening", "good night", "love you", "miss you", "what can you do"
+        ),
+        fact_indicators=(
+            "is", "are", "was", "were", "will", "can", "cannot", "causes", "prevents",
+            "study shows", "research", "scientists", "doctors", "experts", "proven",
+            "fact", "true", "false", "according to", "statistics", "data"
+        ),
+        greeting_reply="Hello! 👋 I'm your AI Myth-Buster bot. Send me any claim or statement you'd like me to fact-check, and I'll help verify its accuracy using reliable sources!",
+        thanks_reply="You're welcome! 😊 Feel free to send me any claims you'd like fact-checked. I'm here to help separate fact from fiction!",
+        help_reply="""🤖 **AI Myth-Buster Help**
+
+I can help you fact-check claims and statements! Here's how:
+
+✅ **Send me claims like:**
+• "Vaccines cause autism"
+• "Climate change is a hoax"
+• "Drinking 8 glasses of water daily is necessary"
+
+❌ **I can't fact-check:**
+• Personal opinions
+• Future predictions
+• Very short messages
+
+Just send me any factual claim and I'll analyze it using AI and reliable sources! 🔍""",
+        default_reply="I'm an AI fact-checker! 🔍 Send me any factual claim or statement you'd like me to verify, and I'll help you determine its accuracy. For example, try sending a health claim, scientific statement, or news fact you've heard!",
+        rate_limit_reply="You're sending messages too quickly. ⏳ Please wait a minute and try again.",
+        media_reply="I received your message with media: {body}\n\nNote: Media fact-checking will be added in future updates. For now, I can only fact-check text claims.",
+        deferred_reply="🔍 Checking this claim now. I'm busier than usual, so I'll send you the result shortly!",
+        overloaded_reply="I'm receiving a lot of fact-check requests right now and couldn't get to yours in time. Please send it again in a few minutes.",
+        shed_reply="Sorry, I couldn't get to your fact-check in time. Please send it again in a few minutes.",
+        error_reply="Sorry, I encountered an error processing your message. Please try again later."
+    ),
+    SPANISH: Locale(
+        code=SPANISH,
+        llm_language="Spanish",
+        greetings=("hola", "buenos días", "buenos dias", "buenas tardes", "buenas noches", "buenas", "qué tal", "que tal"),
+        thanks=("gracias", "muchas gracias", "te lo agradezco"),
+        help_words=("ayuda", "ayúdame", "ayudame", "cómo funciona", "como funciona", "qué puedes hacer", "que puedes hacer"),
+        personal_indicators=(
+            "hola", "qué tal", "que tal", "cómo estás", "como estas", "buenos días", "buenos dias",
+            "buenas tardes", "buenas noches", "gracias", "te quiero", "te extraño", "te extrano",
+            "qué puedes hacer", "que puedes hacer"
+        ),
+        fact_indicators=(
+            "es", "son", "era", "fue", "será", "sera", "puede", "causa", "causan", "cura", "curan",
+            "previene", "estudio", "investigación", "investigacion", "científicos", "cientificos",
+            "médicos", "medicos", "expertos", "comprobado", "verdad", "falso", "cierto", "según", "segun",
+            "estadísticas", "estadisticas", "datos"
+        ),
+        greeting_reply="¡Hola! 👋 Soy tu bot AI Myth-Buster. Envíame cualquier afirmación que quieras verificar y te ayudaré a comprobar si es cierta con fuentes confiables.",
+        thanks_reply="¡De nada! 😊 Envíame cuando quieras cualquier afirmación para verificar. ¡Estoy aquí para separar los hechos de la ficción!",
+        help_reply="""🤖 **Ayuda de AI Myth-Buster**
+
+¡Puedo verificar afirmaciones por ti! Así funciona:
+
+✅ **Envíame afirmaciones como:**
+• "Las vacunas causan autismo"
+• "El cambio climático es un engaño"
+• "Hay que tomar 8 vasos de agua al día"
+
+❌ **No puedo verificar:**
+• Opiniones personales
+• Predicciones del futuro
+• Mensajes muy cortos
+
+¡Envíame cualquier afirmación y la analizaré con IA y fuentes confiables! 🔍""",
+        default_reply="¡Soy un verificador de datos con IA! 🔍 Envíame cualquier afirmación que quieras comprobar, por ejemplo un consejo de salud, un dato científico o una noticia que hayas escuchado.",
+        rate_limit_reply="Estás enviando mensajes demasiado rápido. ⏳ Espera un minuto y vuelve a intentarlo.",
+        media_reply="Recibí tu mensaje con archivos: {body}\n\nNota: la verificación de imágenes y archivos llegará en futuras versiones. Por ahora solo puedo verificar afirmaciones de texto.",
+        deferred_reply="🔍 Estoy verificando esta afirmación. Tengo más trabajo de lo normal, ¡así que te enviaré el resultado en breve!",
+        overloaded_reply="Estoy recibiendo muchas solicitudes de verificación ahora mismo y no pude atender la tuya a tiempo. Envíala de nuevo en unos minutos.",
+        shed_reply="Lo siento, no pude verificar tu afirmación a tiempo. Envíala de nuevo en unos minutos.",
+        error_reply="Lo siento, ocurrió un error al procesar tu mensaje. Inténtalo de nuevo más tarde."
+    ),
+    HINDI: Locale(
+        code=HINDI,
+        llm_language="Hindi (in Devanagari script)",
+        greetings=("नमस्ते", "नमस्कार", "हेलो", "हैलो", "हाय", "सुप्रभात", "शुभ संध्या", "कैसे हो", "क्या हाल है"),
+        thanks=("धन्यवाद", "शुक्रिया", "थैंक्स", "थैंक यू"),
+        help_words=("मदद", "सहायता", "तुम क्या कर सकते हो", "आप क्या कर सकते हैं"),
+        personal_indicators=(
+            "नमस्ते", "नमस्कार", "हेलो", "हैलो", "हाय", "कैसे हो", "कैसे हैं", "क्या हाल है",
+            "सुप्रभात", "शुभ रात्रि", "धन्यवाद", "शुक्रिया", "लव यू", "याद आ रही",
+            "तुम क्या कर सकते हो", "आप क्या कर सकते हैं"
+        ),
+        fact_indicators=(
+            "है", "हैं", "था", "थे", "होगा", "होता", "होती", "कारण", "इलाज", "ठीक", "बचाता",
+            "अध्ययन", "शोध", "वैज्ञानिक", "डॉक्टर", "विशेषज्ञ", "साबित", "सच", "झूठ", "अनुसार", "आंकड़े"
+        ),
+        greeting_reply="नमस्ते! 👋 मैं आपका AI Myth-Buster बॉट हूँ। कोई भी दावा या बात भेजिए जिसकी आप जाँच करवाना चाहते हैं, मैं भरोसेमंद स्रोतों से उसकी सच्चाई जाँचने में मदद करूँगा!",
+        thanks_reply="आपका स्वागत है! 😊 जब चाहें कोई भी दावा जाँच के लिए भेजिए। मैं सच और झूठ को अलग करने में मदद के लिए यहाँ हूँ!",
+        help_reply="""🤖 **AI Myth-Buster मदद**
+
+मैं दावों और बातों की जाँच कर सकता हूँ! ऐसे:
+
+✅ **ऐसे दावे भेजिए:**
+• "टीकों से ऑटिज़्म होता है"
+• "जलवायु परिवर्तन एक धोखा है"
+• "रोज़ 8 गिलास पानी पीना ज़रूरी है"
+
+❌ **मैं इनकी जाँच नहीं कर सकता:**
+• निजी राय
+• भविष्य की भविष्यवाणियाँ
+• बहुत छोटे संदेश
+
+कोई भी दावा भेजिए, मैं AI और भरोसेमंद स्रोतों से उसका विश्लेषण करूँगा! 🔍""",
+        default_reply="मैं एक AI फ़ैक्ट-चेकर हूँ! 🔍 कोई भी दावा भेजिए जिसकी आप जाँच करवाना चाहते हैं, जैसे सेहत से जुड़ी कोई बात, वैज्ञानिक तथ्य या कोई ख़बर जो आपने सुनी हो।",
+        rate_limit_reply="आप बहुत जल्दी-जल्दी संदेश भेज रहे हैं। ⏳ कृपया एक मिनट रुककर फिर से कोशिश करें।",
+        media_reply="मुझे मीडिया के साथ आपका संदेश मिला: {body}\n\nनोट: मीडिया की जाँच आगे के अपडेट में जोड़ी जाएगी। अभी मैं सिर्फ़ लिखे हुए दावों की जाँच कर सकता हूँ।",
+        deferred_reply="🔍 इस दावे की जाँच कर रहा हूँ। अभी काम ज़्यादा है, इसलिए नतीजा थोड़ी देर में भेजूँगा!",
+        overloaded_reply="अभी मुझे बहुत सारे फ़ैक्ट-चेक अनुरोध मिल रहे हैं और मैं समय पर आपका दावा नहीं देख पाया। कृपया कुछ मिनट बाद फिर से भेजें।",
+        shed_reply="माफ़ कीजिए, मैं समय पर आपके दावे की जाँच नहीं कर पाया। कृपया कुछ मिनट बाद फिर से भेजें।",
+        error_reply="माफ़ कीजिए, आपका संदेश प्रोसेस करते समय एक गड़बड़ी हुई। कृपया बाद में फिर से कोशिश करें।"
+    ),
+    URDU: Locale(
+        code=URDU,
+        llm_language="Urdu (in Urdu script)",
+        greetings=("السلام علیکم", "اسلام علیکم", "سلام", "آداب", "ہیلو", "صبح بخیر", "شام بخیر", "کیا حال ہے"),
+        thanks=("شکریہ", "بہت شکریہ", "مہربانی", "تھینکس"),
+        help_words=("مدد", "آپ کیا کر سکتے ہیں", "تم کیا کر سکتے ہو"),
+        personal_indicators=(
+            "السلام علیکم", "اسلام علیکم", "سلام", "آداب", "ہیلو", "کیسے ہو", "کیسے ہیں", "کیا حال ہے",
+            "صبح بخیر", "شب بخیر", "شکریہ", "یاد آ رہی", "آپ کیا کر سکتے ہیں", "تم کیا کر سکتے ہو"
+        ),
+        fact_indicators=(
+            "ہے", "ہیں", "تھا", "تھے", "ہوگا", "ہوتا", "ہوتی", "وجہ", "علاج", "ٹھیک", "بچاتا",
+            "تحقیق", "سائنسدان", "ڈاکٹر", "ماہرین", "ثابت", "سچ", "جھوٹ", "مطابق", "اعداد"
+        ),
+        greeting_reply="السلام علیکم! 👋 میں آپ کا AI Myth-Buster بوٹ ہوں۔ کوئی بھی دعویٰ یا بات بھیجیں جس کی آپ تصدیق چاہتے ہیں، میں معتبر ذرائع سے اس کی سچائی جانچنے میں مدد کروں گا!",
+        thanks_reply="خوش آمدید! 😊 جب چاہیں کوئی بھی دعویٰ تصدیق کے لیے بھیجیں۔ میں سچ اور جھوٹ کو الگ کرنے میں مدد کے لیے یہاں ہوں!",
+        help_reply="""🤖 **AI Myth-Buster مدد**
+
+میں دعووں اور باتوں کی تصدیق کر سکتا ہوں! ایسے:
+
+✅ **ایسے دعوے بھیجیں:**
+• "ویکسین سے آٹزم ہوتا ہے"
+• "موسمیاتی تبدیلی ایک دھوکا ہے"
+• "روزانہ 8 گلاس پانی پینا ضروری ہے"
+
+❌ **میں ان کی تصدیق نہیں کر سکتا:**
+• ذاتی رائے
+• مستقبل کی پیشگوئیاں
+• بہت مختصر پیغامات
+
+کوئی بھی دعویٰ بھیجیں، میں AI اور معتبر ذرائع سے اس کا تجزیہ کروں گا! 🔍""",
+        default_reply="میں ایک AI فیکٹ چیکر ہوں! 🔍 کوئی بھی دعویٰ بھیجیں جس کی آپ تصدیق چاہتے ہیں، جیسے صحت سے متعلق کوئی بات، سائنسی حقیقت یا کوئی خبر جو آپ نے سنی ہو۔",
+        rate_limit_reply="آپ بہت جلدی جلدی پیغامات بھیج رہے ہیں۔ ⏳ براہ کرم ایک منٹ رک کر دوبارہ کوشش کریں۔",
+        media_reply="مجھے میڈیا کے ساتھ آپ کا پیغام ملا: {body}\n\nنوٹ: میڈیا کی تصدیق آئندہ اپڈیٹس میں شامل کی جائے گی۔ فی الحال میں صرف تحریری دعووں کی تصدیق کر سکتا ہوں۔",
+        deferred_reply="🔍 اس دعوے کی تصدیق کر رہا ہوں۔ ابھی کام زیادہ ہے، اس لیے نتیجہ تھوڑی دیر میں بھیجوں گا!",
+        overloaded_reply="اس وقت مجھے بہت زیادہ تصدیق کی درخواستیں مل رہی ہیں اور میں وقت پر آپ کا دعویٰ نہیں دیکھ سکا۔ براہ کرم چند منٹ بعد دوبارہ بھیجیں۔",
+        shed_reply="معذرت، میں وقت پر آپ کے دعوے کی تصدیق نہیں کر سکا۔ براہ کرم چند منٹ بعد دوبارہ بھیجیں۔",
+        error_reply="معذرت، آپ کا پیغام پراسیس کرتے وقت ایک خرابی پیش آئی۔ براہ کرم بعد میں دوبارہ کوشش کریں۔"
+    ),
+    ROMAN_HINDI: Locale(
+        code=ROMAN_HINDI,
+        llm_language="Hinglish (Hindi/Urdu written in Latin script, as the user wrote)",
+        greetings=(
+            "namaste", "namaskar", "salaam", "assalam alaikum", "hello", "hii", "hey", "good morning",
+            "suprabhat", "kaise ho", "kya haal"
+        ),
+        thanks=("dhanyavaad", "dhanyawad", "shukriya", "thanks", "thank you", "thank u"),
+        help_words=("madad", "help", "kya kar sakte ho", "kya kar sakte hain"),
+        personal_indicators=(
+            "namaste", "namaskar", "salaam", "assalam alaikum", "hello", "hii", "kaise ho", "kaise hain",
+            "kya haal hai", "kya haal", "good morning", "good night", "shubh ratri", "shukriya", "thanks",
+            "love you", "miss you", "yaad aa rahi", "kya kar sakte ho", "kya kar sakte hain"
+        ),
+        fact_indicators=(
+            "hai", "hain", "tha", "the", "hoga", "hota", "hoti", "karta", "karti", "se", "ilaj", "ilaaj",
+            "theek", "sach", "jhooth", "jhoot", "galat", "sahi", "study", "research", "scientists",
+            "doctor", "doctors", "experts", "sabit", "hisaab se", "mutabiq", "khabar"
+        ),
+        greeting_reply="Namaste! 👋 Main aapka AI Myth-Buster bot hoon. Koi bhi claim ya baat bhejiye jiski aap jaanch karwana chahte hain, main bharosemand sources se uski sachchai check karne mein madad karunga!",
+        thanks_reply="Aapka swagat hai! 😊 Jab chahein koi bhi claim check karne ke liye bhejiye. Main sach aur jhooth alag karne mein madad ke liye yahan hoon!",
+        help_reply="""🤖 **AI Myth-Buster Help**
+
+Main claims aur baaton ko fact-check kar sakta hoon! Aise:
+
+✅ **Aise claims bhejiye:**
+• "Vaccine se autism hota hai"
+• "Climate change ek dhokha hai"
+• "Roz 8 glass pani peena zaroori hai"
+
+❌ **Main inhe check nahi kar sakta:**
+• Personal opinions
+• Future ki predictions
+• Bahut chhote messages
+
+Koi bhi claim bhejiye, main AI aur bharosemand sources se uska analysis karunga! 🔍""",
+        default_reply="Main ek AI fact-checker hoon! 🔍 Koi bhi claim bhejiye jise aap verify karwana chahte hain, jaise health ki koi baat, science ka fact ya koi khabar jo aapne suni ho.",
+        rate_limit_reply="Aap bahut jaldi-jaldi messages bhej rahe hain. ⏳ Please ek minute ruk kar phir try kijiye.",
+        media_reply="Mujhe media ke saath aapka message mila: {body}\n\nNote: Media fact-checking aage ke updates mein aayegi. Abhi main sirf text claims check kar sakta hoon.",
+        deferred_reply="🔍 Is claim ko check kar raha hoon. Abhi kaam zyada hai, isliye result thodi der mein bhejunga!",
+        overloaded_reply="Abhi mujhe bahut saare fact-check requests mil rahe hain aur main time par aapka claim nahi dekh paaya. Please kuch minute baad phir bhejiye.",
+        shed_reply="Maaf kijiye, main time par aapka claim check nahi kar paaya. Please kuch minute baad phir bhejiye.",
+        error_reply="Maaf kijiye, aapka message process karte waqt ek error aaya. Please baad mein phir try kijiye."
+    ),
+}
+
+
+def get_locale(language: str) -> Locale:
+    """Locale for a language code, English for unknown codes"""
+    return LOCALES.get(language, LOCALES[ENGLISH])
+
+
+def create_language_identifier() -> LanguageIdentifier:
+    """Train the language identifier on LANGID_CORPUS_PATH"""
+    try:
+        identifier = LanguageIdentifier.from_corpus(settings.langid_corpus_path)
+        logger.info(f"Language identifier trained on {settings.langid_corpus_path} ({', '.join(identifier.tables)})")
+        return identifier
+    except FileNotFoundError:
+        logger.warning(f"Language ID corpus {settings.langid_corpus_path} not found; Latin-script messages are treated as English")
+        return LanguageIdentifier()
+
+
+# Global language identifier instance
+language_identifier = create_language_identifier()
+
+
+@tracer.traced("language_id")
+def detect_language(text: str) -> str:
+    """
+    Identify the language of a message
+
+    Args:
+        text: Message text
+
+    Returns:
+        str: Language code (en, es, hi, ur or hi-Latn)
+    """
+    return language_identifier.detect(text)
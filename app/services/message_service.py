@@ -2,9 +2,22 @@
 Message processing service for AI Myth-Buster Bot
 """
 
+import asyncio
 import logging
+import time
+from typing import Optional
+from app.config import settings
+from app.language_id import ENGLISH
 from app.models import WhatsAppMessage, FactCheckRequest, FactCheckResponse, BotResponse
+from app.myth_index import normalize_claim
 from app.services.fact_check_service import fact_check_service
+from app.services.localization import contains_any, detect_language, get_locale
+from app.services.myth_kb import myth_kb
+from app.services.scheduler import scheduler, DeadlineExceeded, LANE_INSTANT, LANE_CACHE, LANE_LLM
+from app.services.tracing import tracer
+from app.services.twilio_service import twilio_service
+from app.services.state_store import state_store
+from app.services.verdict_cache import verdict_cache
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +27,10 @@ class MessageProcessingService:
     
     def __init__(self):
         """Initialize message processing service"""
+        self._deferred_tasks = set()  # Strong references to deferred fact-checks
         logger.info("Message processing service initialized")
     
+    @tracer.traced("process_incoming_message")
     async def process_incoming_message(self, message: WhatsAppMessage) -> BotResponse:
         """
         Process an incoming WhatsApp message and generate a response
@@ -26,47 +41,71 @@ class MessageProcessingService:
         Returns:
             BotResponse: Response to send back to the user
         """
+        language = ENGLISH
         try:
             logger.info(f"Processing message from {message.sender_number}: {message.Body}")
             
+            sender = message.sender_number
+            language = detect_language(message.Body)
+            locale = get_locale(language)
+            
+            # Enforce per-sender rate limit (counters are shared across workers)
+            if await self.is_rate_limited(sender):
+                logger.warning(f"Rate limit exceeded for {sender}")
+                response_text = await scheduler.submit(
+                    LANE_INSTANT, sender,
+                    lambda: locale.rate_limit_reply
+                )
+            
             # Check if message contains media
-            if message.has_media:
-                response_text = f"I received your message with media: {message.Body}\n\nNote: Media fact-checking will be added in future updates. For now, I can only fact-check text claims."
+            elif message.has_media:
+                response_text = await scheduler.submit(
+                    LANE_INSTANT, sender,
+                    lambda: locale.media_reply.format(body=message.Body)
+                )
             
             # Check if this is a fact-checkable message
-            elif fact_check_service.is_fact_checkable(message.Body):
-                logger.info(f"Fact-checking message from {message.sender_number}")
-                
-                # Create fact-check request
-                fact_check_request = await self.create_fact_check_request(message)
+            elif fact_check_service.is_fact_checkable(message.Body, language):
+                logger.info(f"Fact-checking message from {sender} (language: {language})")
                 
-                # Perform AI fact-checking
-                fact_check_response = await fact_check_service.fact_check_claim(fact_check_request)
+                # Cache lane: known myth or a verdict any worker already produced
+                fact_check_response = await scheduler.submit(
+                    LANE_CACHE, sender, lambda: self._lookup_known_verdict(message, language)
+                )
                 
-                # Format the response
-                response_text = f"🔍 **Fact-Check Result:**\n\n{fact_check_response.fact_check_result}"
+                if fact_check_response is not None:
+                    response_text = self._format_fact_check_response(fact_check_response)
                 
-                # Add confidence indicator if available
-                if fact_check_response.confidence_score > 0:
-                    confidence_emoji = "🟢" if fact_check_response.confidence_score > 0.7 else "🟡" if fact_check_response.confidence_score > 0.4 else "🔴"
-                    response_text += f"\n\n{confidence_emoji} Confidence: {int(fact_check_response.confidence_score * 100)}%"
+                elif scheduler.queue_depth(LANE_LLM) >= settings.llm_defer_queue_depth:
+                    # Deep backlog: acknowledge now and send the verdict when it's ready
+                    logger.info(f"LLM backlog of {scheduler.queue_depth(LANE_LLM)}, deferring fact-check for {sender}")
+                    self._defer_fact_check(message, language)
+                    response_text = locale.deferred_reply
                 
-                # Add sources if available
-                if fact_check_response.sources:
-                    response_text += f"\n\n📚 Sources mentioned: {', '.join(fact_check_response.sources)}"
-                
-                response_text += "\n\n💡 Always verify important information from multiple reliable sources!"
+                else:
+                    # LLM lane: fresh fact-check, queued behind a short backlog at most
+                    # and degraded if it can't start before its deadline
+                    fact_check_response = await scheduler.submit(
+                        LANE_LLM, sender,
+                        lambda: self._run_fact_check(message, language),
+                        deadline=settings.llm_deadline_seconds,
+                        degrade=lambda: self._overloaded_fact_check_response(message, language)
+                    )
+                    response_text = self._format_fact_check_response(fact_check_response)
                 
             else:
                 # Handle non-fact-checkable messages (greetings, personal chat, etc.)
-                response_text = self._generate_conversational_response(message.Body)
+                response_text = await scheduler.submit(
+                    LANE_INSTANT, sender, lambda: self._generate_conversational_response(message.Body, language)
+                )
             
             # Create response
-            response = BotResponse(
-                to=message.From,
-                message=response_text,
-                message_type="text"
-            )
+            with tracer.span("model.BotResponse"):
+                response = BotResponse(
+                    to=message.From,
+                    message=response_text,
+                    message_type="text"
+                )
             
             logger.info(f"Generated response for {message.sender_number}")
             return response
@@ -77,10 +116,154 @@ class MessageProcessingService:
             # Return error response
             return BotResponse(
                 to=message.From,
-                message="Sorry, I encountered an error processing your message. Please try again later.",
+                message=get_locale(language).error_reply,
                 message_type="text"
             )
     
+    @tracer.traced("lookup_known_verdict")
+    async def _lookup_known_verdict(self, message: WhatsAppMessage, language: str = ENGLISH) -> Optional[FactCheckResponse]:
+        """
+        Find a verdict without calling the LLM
+        
+        Checks the curated myth knowledge base first (for claims in its
+        language), then the shared verdict cache.
+        
+        Args:
+            message: WhatsAppMessage object
+            language: Language code of the message
+            
+        Returns:
+            Optional[FactCheckResponse]: Known verdict, or None if the LLM is needed
+        """
+        if language == myth_kb.language:
+            known_myth = myth_kb.lookup(message.Body)
+            if known_myth is not None:
+                logger.info(f"Answered {message.MessageSid} from the myth knowledge base")
+                return known_myth
+        return await verdict_cache.get(message.Body, language)
+    
+    async def _run_fact_check(self, message: WhatsAppMessage, language: str = ENGLISH) -> FactCheckResponse:
+        """
+        Fact-check a message with the LLM and cache the verdict
+        
+        Args:
+            message: WhatsAppMessage object
+            language: Language code of the message
+            
+        Returns:
+            FactCheckResponse: Fact-check result
+        """
+        fact_check_request = await self.create_fact_check_request(message, language)
+        fact_check_response = await fact_check_service.fact_check_claim(fact_check_request)
+        
+        # Only cache real verdicts, not error fallbacks
+        if fact_check_response.confidence_score:
+            await verdict_cache.set(message.Body, fact_check_response, language)
+        
+        return fact_check_response
+    
+    def _defer_fact_check(self, message: WhatsAppMessage, language: str = ENGLISH) -> None:
+        """Queue a fact-check whose result is sent as a follow-up message"""
+        task = asyncio.create_task(self._deliver_deferred_fact_check(message, language))
+        self._deferred_tasks.add(task)
+        task.add_done_callback(self._deferred_tasks.discard)
+    
+    async def _deliver_deferred_fact_check(self, message: WhatsAppMessage, language: str = ENGLISH) -> None:
+        """
+        Run a deferred fact-check on the LLM lane and send the result
+        
+        Work still queued after DEFERRED_DEADLINE_SECONDS is shed: the LLM
+        call is skipped and the user is asked to resend.
+        
+        Args:
+            message: WhatsAppMessage object
+            language: Language code of the message
+        """
+        try:
+            fact_check_response = await scheduler.submit(
+                LANE_LLM, message.sender_number,
+                lambda: self._run_fact_check(message, language),
+                deadline=settings.deferred_deadline_seconds
+            )
+            response_text = self._format_fact_check_response(fact_check_response)
+        except DeadlineExceeded:
+            response_text = get_locale(language).shed_reply
+        except Exception as e:
+            logger.error(f"Error in deferred fact-check for {message.sender_number}: {e}")
+            response_text = get_locale(language).error_reply
+        
+        await twilio_service.send_message(message.From, response_text)
+    
+    def _overloaded_fact_check_response(self, message: WhatsAppMessage, language: str = ENGLISH) -> FactCheckResponse:
+        """Fallback when a fact-check waited too long for an LLM slot"""
+        return FactCheckResponse(
+            original_message=message.Body,
+            fact_check_result=get_locale(language).overloaded_reply,
+            confidence_score=0.0,
+            sources=[],
+            is_safe_to_process=True
+        )
+    
+    def _format_fact_check_response(self, fact_check_response: FactCheckResponse) -> str:
+        """
+        Format a fact-check result as a WhatsApp message
+        
+        Args:
+            fact_check_response: Fact-check result
+            
+        Returns:
+            str: Message text
+        """
+        response_text = f"🔍 **Fact-Check Result:**\n\n{fact_check_response.fact_check_result}"
+        
+        # Add confidence indicator if available
+        if fact_check_response.confidence_score > 0:
+            confidence_emoji = "🟢" if fact_check_response.confidence_score > 0.7 else "🟡" if fact_check_response.confidence_score > 0.4 else "🔴"
+            response_text += f"\n\n{confidence_emoji} Confidence: {int(fact_check_response.confidence_score * 100)}%"
+        
+        # Add sources if available
+        if fact_check_response.sources:
+            response_text += f"\n\n📚 Sources mentioned: {', '.join(fact_check_response.sources)}"
+        
+        response_text += "\n\n💡 Always verify important information from multiple reliable sources!"
+        return response_text
+    
+    @tracer.traced("dedup")
+    async def is_duplicate(self, message_sid: str) -> bool:
+        """
+        Record a MessageSid and report whether it was already seen
+        
+        Args:
+            message_sid: Twilio MessageSid of the incoming message
+            
+        Returns:
+            bool: True if any worker has already handled this message
+        """
+        try:
+            return not await state_store.add_if_absent(f"sid:{message_sid}", settings.dedup_ttl)
+        except Exception as e:
+            logger.error(f"Error checking MessageSid dedup: {e}")
+            return False
+    
+    @tracer.traced("rate_limit")
+    async def is_rate_limited(self, sender: str) -> bool:
+        """
+        Count a message against the sender's per-minute budget
+        
+        Args:
+            sender: Sender phone number
+            
+        Returns:
+            bool: True if the sender has exceeded the limit
+        """
+        window = int(time.time() // 60)
+        try:
+            count = await state_store.incr(f"rate:{sender}:{window}", 60)
+        except Exception as e:
+            logger.error(f"Error updating rate limit counter: {e}")
+            return False
+        return count > settings.rate_limit_per_minute
+    
     def is_safe_to_process(self, message: str) -> bool:
         """
         Check if a message is safe to process (not personal chat)
@@ -114,12 +297,14 @@ class MessageProcessingService:
         
         return True
     
-    async def create_fact_check_request(self, message: WhatsAppMessage) -> FactCheckRequest:
+    @tracer.traced("model.FactCheckRequest")
+    async def create_fact_check_request(self, message: WhatsAppMessage, language: str = ENGLISH) -> FactCheckRequest:
         """
         Create a fact-check request from a WhatsApp message
         
         Args:
             message: WhatsAppMessage object
+            language: Language code of the message
             
         Returns:
             FactCheckRequest: Structured request for fact-checking
@@ -127,50 +312,39 @@ class MessageProcessingService:
         return FactCheckRequest(
             message=message.Body,
             sender=message.sender_number,
-            message_id=message.MessageSid
+            message_id=message.MessageSid,
+            language=language
         )
     
-    def _generate_conversational_response(self, message: str) -> str:
+    def _generate_conversational_response(self, message: str, language: str = ENGLISH) -> str:
         """
         Generate a conversational response for non-fact-checkable messages
         
         Args:
             message: The incoming message
+            language: Language code of the message (selects keywords and reply)
             
         Returns:
             str: Appropriate conversational response
         """
-        message_lower = message.lower()
+        locale = get_locale(language)
+        normalized = normalize_claim(message)
         
         # Greetings
-        if any(greeting in message_lower for greeting in ["hello", "hi", "hey", "good morning", "good evening"]):
-            return "Hello! 👋 I'm your AI Myth-Buster bot. Send me any claim or statement you'd like me to fact-check, and I'll help verify its accuracy using reliable sources!"
+        if contains_any(normalized, locale.greetings):
+            return locale.greeting_reply
         
         # Thanks
-        elif any(thanks in message_lower for thanks in ["thank", "thanks"]):
-            return "You're welcome! 😊 Feel free to send me any claims you'd like fact-checked. I'm here to help separate fact from fiction!"
+        elif contains_any(normalized, locale.thanks):
+            return locale.thanks_reply
         
         # Help requests
-        elif any(help_word in message_lower for help_word in ["help", "how", "what can you do"]):
-            return """🤖 **AI Myth-Buster Help**
-
-I can help you fact-check claims and statements! Here's how:
-
-✅ **Send me claims like:**
-• "Vaccines cause autism"
-• "Climate change is a hoax" 
-• "Drinking 8 glasses of water daily is necessary"
-
-❌ **I can't fact-check:**
-• Personal opinions
-• Future predictions
-• Very short messages
-
-Just send me any factual claim and I'll analyze it using AI and reliable sources! 🔍"""
+        elif contains_any(normalized, locale.help_words):
+            return locale.help_reply
         
         # Default response for unclear messages
         else:
-            return "I'm an AI fact-checker! 🔍 Send me any factual claim or statement you'd like me to verify, and I'll help you determine its accuracy. For example, try sending a health claim, scientific statement, or news fact you've heard!"
+            return locale.default_reply
 
     async def generate_fact_check_response(self, request: FactCheckRequest) -> FactCheckResponse:
         """
@@ -0,0 +1,59 @@
+"""
+Local mock LLM provider for AI Myth-Buster Bot
+
+Mimics the subset of the Groq client used by FactCheckService so the full
+pipeline can run and be benchmarked without network access or API keys.
+Latency spikes and a limited provider capacity can be injected to exercise
+the overload handling.
+"""
+
+import random
+import threading
+import time
+from types import SimpleNamespace
+
+
+class _MockCompletions:
+    """Stand-in for client.chat.completions"""
+
+    def __init__(self, latency_ms: int, spike_probability: float, spike_ms: int, capacity: int):
+        self.latency_ms = latency_ms
+        self.spike_probability = spike_probability
+        self.spike_ms = spike_ms
+        self.capacity = capacity
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def _latency(self) -> float:
+        """Simulated latency in seconds for a call starting now"""
+        latency = self.latency_ms
+        if self.capacity and self.in_flight > self.capacity:
+            # An overloaded provider slows down in proportion to its backlog
+            latency *= self.in_flight / self.capacity
+        if self.spike_probability and random.random() < self.spike_probability:
+            latency += self.spike_ms
+        return latency / 1000
+
+    def create(self, model: str, messages: list, **kwargs) -> SimpleNamespace:
+        """Return a canned verdict after the simulated latency (blocking, like the real client)"""
+        with self._lock:
+            self.in_flight += 1
+            latency = self._latency()
+        try:
+            time.sleep(latency)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        content = (
+            "FALSE. There is no reliable evidence supporting this claim. "
+            "Health and science bodies such as WHO and CDC have found no support for it."
+        )
+        message = SimpleNamespace(role="assistant", content=content)
+        return SimpleNamespace(model=model, choices=[SimpleNamespace(index=0, message=message)])
+
+
+class MockGroqClient:
+    """Drop-in replacement for groq.Groq"""
+
+    def __init__(self, latency_ms: int = 200, spike_probability: float = 0.0, spike_ms: int = 2000, capacity: int = 0):
+        self.chat = SimpleNamespace(completions=_MockCompletions(latency_ms, spike_probability, spike_ms, capacity))
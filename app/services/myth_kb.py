@@ -0,0 +1,104 @@
+"""
+Myth knowledge base service for AI Myth-Buster Bot
+
+Answers well-known myths from the precompiled, memory-mapped myth index
+(see app/myth_index.py) instead of calling the LLM. The index file is
+re-checked periodically and remapped when it changes, so a rebuilt index
+is picked up without restarting workers.
+"""
+
+import logging
+import os
+import time
+from typing import Optional
+from app.config import settings
+from app.language_id import ENGLISH
+from app.models import FactCheckResponse
+from app.myth_index import MythIndex
+
+logger = logging.getLogger(__name__)
+
+
+class MythKnowledgeBase:
+    """Lookup of curated myth verdicts with hot reload"""
+
+    language = ENGLISH  # Language the curated claims and verdicts are written in
+
+    def __init__(self, index_path: str, reload_interval: float):
+        """
+        Args:
+            index_path: Compiled myth index file
+            reload_interval: Seconds between checks for a rebuilt index
+        """
+        self.index_path = index_path
+        self.reload_interval = reload_interval
+        self._index: Optional[MythIndex] = None
+        self._signature = None
+        self._checked_at = 0.0
+        self._missing_logged = False
+        self._reload()
+
+    def _reload(self) -> None:
+        """Map the index file if it changed since it was last mapped"""
+        self._checked_at = time.monotonic()
+        try:
+            stat = os.stat(self.index_path)
+        except FileNotFoundError:
+            if not self._missing_logged:
+                logger.warning(f"Myth index {self.index_path} not found; knowledge base disabled")
+                self._missing_logged = True
+            self._index, self._signature = None, None
+            return
+        self._missing_logged = False
+
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return
+        try:
+            self._index = MythIndex(self.index_path)
+            self._signature = signature
+            logger.info(f"Loaded myth index {self.index_path} ({len(self._index)} myths)")
+        except Exception as e:
+            logger.error(f"Failed to load myth index {self.index_path}: {e}")
+
+    @property
+    def index(self) -> Optional[MythIndex]:
+        if time.monotonic() - self._checked_at >= self.reload_interval:
+            self._reload()
+        return self._index
+
+    def lookup(self, claim: str) -> Optional[FactCheckResponse]:
+        """
+        Look up a claim in the knowledge base
+
+        Args:
+            claim: The claim as sent by the user
+
+        Returns:
+            Optional[FactCheckResponse]: Vetted verdict, or None if the claim is not a known myth
+        """
+        index = self.index
+        if index is None:
+            return None
+
+        myth = index.lookup(claim)
+        if myth is None:
+            match = index.similar(claim, settings.myth_kb_min_similarity)
+            if match is None:
+                return None
+            myth = match[0]
+
+        return FactCheckResponse(
+            original_message=claim,
+            fact_check_result=(
+                f"Your message looks like the well-known claim \"{myth['claim']}\"\n\n"
+                f"That claim is {myth['verdict']}. {myth['explanation']}"
+            ),
+            confidence_score=0.95,  # Curated and vetted
+            sources=myth["sources"],
+            is_safe_to_process=True
+        )
+
+
+# Global knowledge base instance
+myth_kb = MythKnowledgeBase(settings.myth_kb_index_path, settings.myth_kb_reload_interval)
@@ -0,0 +1,70 @@
+"""
+On-demand sampling profiler for AI Myth-Buster Bot
+
+Samples the Python stacks of a live worker for a bounded time and returns
+them in the collapsed-stack format ("frame;frame;frame count" per line)
+read by flamegraph.pl, speedscope and inferno.
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+
+class SamplingProfiler:
+    """Wall-clock stack sampler over all threads of this process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()  # One profile at a time per worker
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    def profile(self, seconds: float, interval: float, thread_name: Optional[str] = None) -> str:
+        """
+        Sample stacks until seconds have elapsed (blocking; run it in a thread)
+
+        Args:
+            seconds: How long to sample
+            interval: Seconds between samples
+            thread_name: Only sample threads whose name starts with this
+                (e.g. "MainThread" for the event loop, "llm" for LLM calls)
+
+        Returns:
+            str: Collapsed stacks, one "stack count" line each, root frame first
+
+        Raises:
+            RuntimeError: If a profile is already running in this worker
+        """
+        if not self._lock.acquire(blocking=False):
+            raise RuntimeError("A profile is already running in this worker")
+        try:
+            own_id = threading.get_ident()
+            counts: Counter = Counter()
+            deadline = time.monotonic() + seconds
+            while time.monotonic() < deadline:
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id == own_id:
+                        continue
+                    name = names.get(thread_id, str(thread_id))
+                    if thread_name and not name.startswith(thread_name):
+                        continue
+                    stack = []
+                    while frame is not None:
+                        code = frame.f_code
+                        stack.append(f"{code.co_qualname} ({code.co_filename}:{frame.f_lineno})")
+                        frame = frame.f_back
+                    stack.append(f"thread:{name}")
+                    counts[";".join(reversed(stack))] += 1
+                time.sleep(interval)
+            return "".join(f"{stack} {count}\n" for stack, count in counts.most_common())
+        finally:
+            self._lock.release()
+
+
+# Global profiler instance
+profiler = SamplingProfiler()
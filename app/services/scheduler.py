@@ -0,0 +1,269 @@
+"""
+Lane scheduler for AI Myth-Buster Bot
+
+Work is split into lanes so cheap replies never queue behind slow LLM
+calls:
+
+- instant: conversational replies (pure string work)
+- cache:   verdict cache lookups
+- llm:     fresh fact-checks against the LLM
+
+Each lane has its own concurrency limit (the llm lane's limit adapts to
+observed LLM latency, see app/services/concurrency.py). Queued work inside a lane is
+served deficit-round-robin across senders, so one chatty sender cannot
+starve everyone else. Work that is still queued when its deadline passes
+is degraded (a fallback reply) or dropped.
+"""
+
+import asyncio
+import contextvars
+import inspect
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Union
+from app.config import settings
+from app.services.concurrency import AdaptiveConcurrencyLimiter, llm_limiter
+from app.services.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+LANE_INSTANT = "instant"
+LANE_CACHE = "cache"
+LANE_LLM = "llm"
+
+
+class DeadlineExceeded(Exception):
+    """Raised when queued work misses its deadline and has no fallback"""
+
+
+class LatencyStats:
+    """Rolling latency samples for one lane"""
+
+    def __init__(self, max_samples: int = 1024):
+        self.queue_wait: Deque[float] = deque(maxlen=max_samples)
+        self.service_time: Deque[float] = deque(maxlen=max_samples)
+        self.completed = 0
+        self.degraded = 0
+        self.dropped = 0
+
+    @staticmethod
+    def _summary(samples: Deque[float]) -> Dict[str, float]:
+        if not samples:
+            return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0}
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return {
+            f"p{p}_ms": round(ordered[min(last, int(last * p / 100))] * 1000, 2)
+            for p in (50, 95, 99)
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Percentiles of each latency component plus outcome counters"""
+        return {
+            "completed": self.completed,
+            "degraded": self.degraded,
+            "dropped": self.dropped,
+            "queue_wait": self._summary(self.queue_wait),
+            "service_time": self._summary(self.service_time),
+        }
+
+
+class _Job:
+    """A unit of queued work"""
+
+    __slots__ = ("sender", "work", "weight", "future", "enqueued_at", "started", "context")
+
+    def __init__(self, sender: str, work: Callable[[], Any], weight: float):
+        self.sender = sender
+        self.work = work
+        self.weight = weight
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.enqueued_at = time.monotonic()
+        self.started = False
+        # Run the work in the submitter's context (e.g. its trace span),
+        # not that of whichever job's completion dispatches it
+        self.context = contextvars.copy_context()
+
+
+class _Lane:
+    """Concurrency-limited lane with per-sender fair queueing"""
+
+    def __init__(self, name: str, limit: Union[int, AdaptiveConcurrencyLimiter, None]):
+        self.name = name
+        self.limit = limit
+        self.running = 0
+        self.queues: Dict[str, Deque[_Job]] = {}
+        self.active: Deque[str] = deque()  # Senders with queued work, in round-robin order
+        self.deficits: Dict[str, float] = {}
+        self.stats = LatencyStats()
+
+    @property
+    def max_concurrency(self) -> Optional[int]:
+        if isinstance(self.limit, AdaptiveConcurrencyLimiter):
+            return self.limit.limit
+        return self.limit
+
+    @property
+    def has_capacity(self) -> bool:
+        return self.max_concurrency is None or self.running < self.max_concurrency
+
+    @property
+    def queued(self) -> int:
+        return sum(not job.future.done() for queue in self.queues.values() for job in queue)
+
+    def enqueue(self, job: _Job) -> None:
+        queue = self.queues.get(job.sender)
+        if queue is None:
+            queue = self.queues[job.sender] = deque()
+            self.active.append(job.sender)
+            self.deficits[job.sender] = 0.0
+        queue.append(job)
+
+    def next_job(self) -> Optional[_Job]:
+        """Pick the next job using deficit round-robin across senders"""
+        while self.active:
+            sender = self.active[0]
+            queue = self.queues[sender]
+            # Skip jobs abandoned by callers whose deadline passed
+            while queue and queue[0].future.done():
+                queue.popleft()
+            if not queue:
+                self.active.popleft()
+                del self.queues[sender]
+                del self.deficits[sender]
+                continue
+            if self.deficits[sender] < 1.0:
+                self.deficits[sender] += queue[0].weight
+                self.active.rotate(-1)
+                continue
+            self.deficits[sender] -= 1.0
+            return queue.popleft()
+        return None
+
+
+class LaneScheduler:
+    """Schedules work onto the instant, cache and llm lanes"""
+
+    def __init__(self, limits: Dict[str, Union[int, AdaptiveConcurrencyLimiter, None]]):
+        """
+        Args:
+            limits: Max concurrent jobs per lane (None for unlimited, or an
+                adaptive limiter whose current limit is used)
+        """
+        self.lanes = {name: _Lane(name, limit) for name, limit in limits.items()}
+        self._tasks = set()  # Strong references to running jobs
+        logger.info(f"Lane scheduler initialized with limits { {name: lane.max_concurrency for name, lane in self.lanes.items()} }")
+
+    async def submit(
+        self,
+        lane: str,
+        sender: str,
+        work: Callable[[], Any],
+        deadline: Optional[float] = None,
+        degrade: Optional[Callable[[], Any]] = None,
+        weight: float = 1.0
+    ) -> Any:
+        """
+        Run work on a lane, queueing it if the lane is saturated
+
+        Args:
+            lane: Lane name (LANE_INSTANT, LANE_CACHE or LANE_LLM)
+            sender: Sender identity used for fair queueing
+            work: Function performing the work (may be a coroutine function)
+            deadline: Seconds the work may wait in the queue before it is
+                degraded or dropped (None to wait indefinitely)
+            degrade: Function producing a fallback result when the deadline
+                passes (may be a coroutine function)
+            weight: Sender's share of the lane relative to other senders
+
+        Returns:
+            Any: Result of work (or of degrade)
+
+        Raises:
+            DeadlineExceeded: If the deadline passed and no degrade was given
+        """
+        state = self.lanes[lane]
+        job = _Job(sender, work, weight)
+        state.enqueue(job)
+        self._dispatch(state)
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(job.future), deadline)
+        except asyncio.TimeoutError:
+            if job.started:
+                # Already running: the result is still worth delivering
+                return await job.future
+            job.future.cancel()
+            if degrade is not None:
+                state.stats.degraded += 1
+                logger.warning(f"Degrading {lane} work for {sender} after {deadline}s in queue")
+                result = degrade()
+                return await result if inspect.isawaitable(result) else result
+            state.stats.dropped += 1
+            logger.warning(f"Dropping {lane} work for {sender} after {deadline}s in queue")
+            raise DeadlineExceeded(f"{lane} work for {sender} missed its {deadline}s deadline")
+
+    def _start(self, state: _Lane, job: _Job) -> None:
+        state.running += 1
+        job.started = True
+        queue_wait = time.monotonic() - job.enqueued_at
+        state.stats.queue_wait.append(queue_wait)
+        task = asyncio.get_running_loop().create_task(self._run(state, job, queue_wait), context=job.context)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, state: _Lane, job: _Job, queue_wait: float) -> None:
+        started_at = time.monotonic()
+        try:
+            with tracer.span(f"lane.{state.name}", **{"lane.queue_wait_ms": round(queue_wait * 1000, 3)}):
+                result = job.work()
+                if inspect.isawaitable(result):
+                    result = await result
+        except Exception as e:
+            if not job.future.done():
+                job.future.set_exception(e)
+        else:
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            state.stats.service_time.append(time.monotonic() - started_at)
+            state.stats.completed += 1
+            state.running -= 1
+            self._dispatch(state)
+
+    def _dispatch(self, state: _Lane) -> None:
+        while state.has_capacity:
+            job = state.next_job()
+            if job is None:
+                return
+            self._start(state, job)
+
+    def is_saturated(self, lane: str) -> bool:
+        """True if new work on the lane would have to queue"""
+        state = self.lanes[lane]
+        return not state.has_capacity or state.queued > 0
+
+    def queue_depth(self, lane: str) -> int:
+        """Number of jobs waiting on the lane"""
+        return self.lanes[lane].queued
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-lane queue depth, concurrency and latency breakdown"""
+        return {
+            name: {
+                "running": state.running,
+                "queued": state.queued,
+                "max_concurrency": state.max_concurrency,
+                **state.stats.snapshot(),
+            }
+            for name, state in self.lanes.items()
+        }
+
+
+# Global scheduler instance
+scheduler = LaneScheduler({
+    LANE_INSTANT: None,
+    LANE_CACHE: settings.cache_max_concurrency,
+    LANE_LLM: llm_limiter,
+})
@@ -0,0 +1,265 @@
+"""
+Shared state store for AI Myth-Buster Bot
+
+Holds the verdict cache, MessageSid dedup set and rate-limit counters so
+that every uvicorn worker process sees the same state.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StateStore:
+    """Base interface for key/value stores with expiry"""
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the value stored under key, or None if missing/expired"""
+        raise NotImplementedError
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        """Store value under key for ttl seconds"""
+        raise NotImplementedError
+
+    async def add_if_absent(self, key: str, ttl: int) -> bool:
+        """
+        Atomically mark key as seen
+
+        Returns:
+            bool: True if the key was newly added, False if it already existed
+        """
+        raise NotImplementedError
+
+    async def incr(self, key: str, ttl: int) -> int:
+        """
+        Atomically increment a counter that expires ttl seconds after creation
+
+        Returns:
+            int: The counter value after incrementing
+        """
+        raise NotImplementedError
+
+
+class MemoryStateStore(StateStore):
+    """In-process store (single worker only, state is not shared)"""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[str, float]] = {}
+
+    def _live(self, key: str, now: float) -> Optional[str]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= now:
+            del self._data[key]
+            return None
+        return entry[0]
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._live(key, time.time())
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        self._data[key] = (value, time.time() + ttl)
+
+    async def add_if_absent(self, key: str, ttl: int) -> bool:
+        now = time.time()
+        if self._live(key, now) is not None:
+            return False
+        self._data[key] = ("1", now + ttl)
+        return True
+
+    async def incr(self, key: str, ttl: int) -> int:
+        now = time.time()
+        current = self._live(key, now)
+        if current is None:
+            self._data[key] = ("1", now + ttl)
+            return 1
+        value = int(current) + 1
+        self._data[key] = (str(value), self._data[key][1])
+        return value
+
+
+class SQLiteStateStore(StateStore):
+    """
+    SQLite store in WAL mode, shared by all worker processes on one host
+
+    Every operation is a single statement, so they are atomic across
+    processes without explicit locking. Statements run on a dedicated
+    thread so a locked database never stalls the event loop, and the
+    busy timeout is short: a call that can't get the lock in time raises,
+    and callers fail open (cache miss, not a duplicate, not rate limited).
+    """
+
+    PURGE_EVERY = 1000  # Writes between purges of expired rows
+
+    def __init__(self, path: str, timeout: float = 0.25):
+        """
+        Args:
+            path: SQLite database file
+            timeout: Seconds a statement waits for another process's lock
+        """
+        self.path = path
+        self.timeout = timeout
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pid: Optional[int] = None
+        self._writes = 0
+
+    def _ensure_process(self) -> None:
+        """Per-process connection and thread (neither may cross a fork)"""
+        if self._pid != os.getpid():
+            self._conn = None
+            # One thread per process: statements on the connection never overlap
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-sqlite")
+            self._pid = os.getpid()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Connection of this process (only used from the store's thread)"""
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None, timeout=self.timeout, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS kv ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking statement on the store's thread"""
+        self._ensure_process()
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _after_write(self, now: float) -> None:
+        self._writes += 1
+        if self._writes % self.PURGE_EVERY == 0:
+            self.conn.execute("DELETE FROM kv WHERE expires_at <= ?", (now,))
+
+    def _get(self, key: str) -> Optional[str]:
+        row = self.conn.execute(
+            "SELECT value FROM kv WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set(self, key: str, value: str, ttl: int) -> None:
+        now = time.time()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO kv (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, now + ttl)
+        )
+        self._after_write(now)
+
+    def _add_if_absent(self, key: str, ttl: int) -> bool:
+        now = time.time()
+        cursor = self.conn.execute(
+            "INSERT INTO kv (key, value, expires_at) VALUES (?, '1', ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at "
+            "WHERE kv.expires_at <= ?",
+            (key, now + ttl, now)
+        )
+        self._after_write(now)
+        return cursor.rowcount == 1
+
+    def _incr(self, key: str, ttl: int) -> int:
+        now = time.time()
+        row = self.conn.execute(
+            "INSERT INTO kv (key, value, expires_at) VALUES (?, '1', ?) "
+            "ON CONFLICT(key) DO UPDATE SET "
+            "value = CASE WHEN kv.expires_at <= ? THEN '1' ELSE CAST(kv.value AS INTEGER) + 1 END, "
+            "expires_at = CASE WHEN kv.expires_at <= ? THEN excluded.expires_at ELSE kv.expires_at END "
+            "RETURNING value",
+            (key, now + ttl, now, now)
+        ).fetchone()
+        self._after_write(now)
+        return int(row[0])
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._run(self._get, key)
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        await self._run(self._set, key, value, ttl)
+
+    async def add_if_absent(self, key: str, ttl: int) -> bool:
+        return await self._run(self._add_if_absent, key, ttl)
+
+    async def incr(self, key: str, ttl: int) -> int:
+        return await self._run(self._incr, key, ttl)
+
+
+class RedisStateStore(StateStore):
+    """Store backed by any Redis-protocol server (Redis, Valkey, KeyDB, Dragonfly)"""
+
+    _INCR_SCRIPT = """
+local value = redis.call('INCR', KEYS[1])
+if value == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return value
+"""
+
+    def __init__(self, url: str):
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError("The redis state backend requires the 'redis' package (pip install redis)") from e
+        self.url = url
+        self._redis_asyncio = redis_asyncio
+        self._client = None
+        self._loop = None
+
+    @property
+    def client(self):
+        """Lazily create the client on the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = self._redis_asyncio.from_url(self.url, decode_responses=True)
+            self._loop = loop
+        return self._client
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self.client.get(key)
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        await self.client.set(key, value, ex=ttl)
+
+    async def add_if_absent(self, key: str, ttl: int) -> bool:
+        return bool(await self.client.set(key, "1", ex=ttl, nx=True))
+
+    async def incr(self, key: str, ttl: int) -> int:
+        # INCR and EXPIRE in one script, so a counter can never be left without a TTL
+        return int(await self.client.eval(self._INCR_SCRIPT, 1, key, ttl))
+
+
+def create_state_store(backend: str) -> StateStore:
+    """
+    Create the configured state store
+
+    Args:
+        backend: One of "memory", "sqlite" or "redis"
+
+    Returns:
+        StateStore: Store instance for this process
+    """
+    if backend == "memory":
+        return MemoryStateStore()
+    if backend == "sqlite":
+        return SQLiteStateStore(settings.state_db_path, settings.state_db_timeout)
+    if backend == "redis":
+        if not settings.redis_url:
+            raise ValueError("REDIS_URL must be set when STATE_BACKEND=redis")
+        return RedisStateStore(settings.redis_url)
+    raise ValueError(f"Unknown state backend: {backend}")
+
+
+# Global store instance
+state_store = create_state_store(settings.state_backend)
+logger.info(f"Shared state store initialized ({settings.state_backend})")
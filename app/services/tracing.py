@@ -0,0 +1,296 @@
+"""
+Request tracing for AI Myth-Buster Bot
+
+Lightweight spans through the webhook -> message processing -> fact-check
+-> Twilio path. Finished spans are batched on a background thread and
+exported as OTLP/JSON (the OpenTelemetry protocol's JSON encoding), either
+appended to a local file (one ExportTraceServiceRequest per line, the
+format of the OpenTelemetry Collector's file exporter) or POSTed to an
+OTLP/HTTP collector endpoint.
+
+Usage:
+    with tracer.span("classify", sender=sender):
+        ...
+
+    @tracer.traced("process_incoming_message")
+    async def process_incoming_message(self, message): ...
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """A timed operation within a trace"""
+
+    __slots__ = ("name", "kind", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "status", "status_message")
+
+    def __init__(self, name: str, kind: int, trace_id: str, parent_id: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = attributes
+        self.status = STATUS_OK
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """OTLP/JSON representation of the span"""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": self.status},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+# Marks a trace that was not sampled, so its child spans are skipped too
+_NOT_SAMPLED = object()
+_current_span: ContextVar[Any] = ContextVar("current_span", default=None)
+
+
+class SpanExporter:
+    """Batches finished spans and exports them from a background thread"""
+
+    def __init__(self, service_name: str, file_path: Optional[str], collector_url: Optional[str],
+                 max_batch: int = 512, flush_interval: float = 1.0):
+        self.service_name = service_name
+        self.file_path = file_path
+        self.collector_url = collector_url
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Span]" = queue.Queue(maxsize=max_batch * 20)
+        self._dropped = 0
+        self._lock = threading.Lock()  # Serializes writes from the worker and atexit
+        self._thread = threading.Thread(target=self._worker, name="span-exporter", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def export(self, span: Span) -> None:
+        """Queue a finished span (dropped if the exporter falls behind)"""
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self._dropped += 1
+
+    def _drain(self) -> List[Span]:
+        spans = []
+        while len(spans) < self.max_batch:
+            try:
+                spans.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return spans
+
+    def _worker(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def flush(self) -> None:
+        """Export everything queued so far"""
+        with self._lock:
+            while True:
+                spans = self._drain()
+                if not spans:
+                    return
+                self._write(spans)
+
+    def _request(self, spans: List[Span]) -> Dict[str, Any]:
+        """Build an OTLP ExportTraceServiceRequest"""
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    _otlp_attribute("service.name", self.service_name),
+                    _otlp_attribute("process.pid", os.getpid()),
+                ]},
+                "scopeSpans": [{
+                    "scope": {"name": __name__},
+                    "spans": [span.to_otlp() for span in spans],
+                }],
+            }]
+        }
+
+    def _write(self, spans: List[Span]) -> None:
+        payload = json.dumps(self._request(spans), separators=(",", ":"))
+        try:
+            if self.file_path:
+                with open(self.file_path, "a", encoding="utf-8") as f:
+                    f.write(payload + "\n")
+            if self.collector_url:
+                import httpx
+                httpx.post(self.collector_url, content=payload,
+                           headers={"Content-Type": "application/json"}, timeout=5.0)
+        except Exception as e:
+            logger.error(f"Error exporting {len(spans)} spans: {e}")
+        if self._dropped:
+            logger.warning(f"Dropped {self._dropped} spans (exporter queue full)")
+            self._dropped = 0
+
+
+class Tracer:
+    """Creates spans and hands finished ones to the exporter"""
+
+    def __init__(self, exporter: Optional[SpanExporter], sample_rate: float = 1.0):
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    @contextmanager
+    def span(self, name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> Iterator[Optional[Span]]:
+        """
+        Time a block of code as a span, nested under the current span
+
+        Args:
+            name: Span name
+            kind: SPAN_KIND_INTERNAL, SPAN_KIND_SERVER or SPAN_KIND_CLIENT
+            **attributes: Span attributes
+
+        Yields:
+            Optional[Span]: The span, or None when tracing is off or the
+                trace was not sampled
+        """
+        if self.exporter is None:
+            yield None
+            return
+
+        parent = _current_span.get()
+        if parent is _NOT_SAMPLED or (parent is None and random.random() >= self.sample_rate):
+            token = _current_span.set(_NOT_SAMPLED)
+            try:
+                yield None
+            finally:
+                _current_span.reset(token)
+            return
+
+        if parent is None:
+            span = Span(name, kind, os.urandom(16).hex(), "", attributes)
+        else:
+            span = Span(name, kind, parent.trace_id, parent.span_id, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status = STATUS_ERROR
+            span.status_message = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            _current_span.reset(token)
+            self.exporter.export(span)
+
+
+    def traced(self, name: str, kind: int = SPAN_KIND_INTERNAL) -> Callable:
+        """
+        Decorator wrapping every call of a function in a span
+
+        When tracing is off the function is returned unchanged, so the hot
+        path pays nothing.
+
+        Args:
+            name: Span name
+            kind: Span kind
+        """
+        def decorator(func: Callable) -> Callable:
+            if self.exporter is None:
+                return func
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(name, kind):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name, kind):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a server span per HTTP request (covers form parsing and validation)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        status = {}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        with tracer.span(f"{scope['method']} {scope['path']}", SPAN_KIND_SERVER,
+                         **{"http.method": scope["method"], "http.target": scope["path"]}) as span:
+            await self.app(scope, receive, send_with_status)
+            if span is not None:
+                span.set_attribute("http.status_code", status.get("code", 0))
+
+
+def create_tracer() -> Tracer:
+    """Create the tracer configured by TRACING_ENABLED and the export settings"""
+    if not settings.tracing_enabled:
+        return Tracer(None)
+    exporter = SpanExporter("ai-myth-buster", settings.trace_export_path, settings.trace_collector_url)
+    logger.info(f"Tracing enabled (file: {settings.trace_export_path}, collector: {settings.trace_collector_url})")
+    return Tracer(exporter, settings.trace_sample_rate)
+
+
+# Global tracer instance
+tracer = create_tracer()
@@ -7,6 +7,7 @@ from twilio.rest import Client
 from twilio.base.exceptions import TwilioException
 from app.config import settings
 from app.models import BotResponse
+from app.services.tracing import tracer, SPAN_KIND_CLIENT
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,7 @@ class TwilioWhatsAppService:
             logger.error(f"Failed to initialize Twilio client: {e}")
             raise
     
+    @tracer.traced("twilio.send_message", SPAN_KIND_CLIENT)
     async def send_message(self, to: str, message: str) -> bool:
         """
         Send a WhatsApp message via Twilio
@@ -40,6 +42,10 @@ class TwilioWhatsAppService:
             if not to.startswith("whatsapp:"):
                 to = f"whatsapp:{to}"
             
+            if settings.twilio_dry_run:
+                logger.info(f"Dry run: not sending message to {to}")
+                return True
+            
             # Send message via Twilio
             message_instance = self.client.messages.create(
                 body=message,
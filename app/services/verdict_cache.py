@@ -0,0 +1,69 @@
+"""
+Verdict cache for AI Myth-Buster Bot
+
+Stores completed fact-checks in the shared state store, keyed by the
+message language and a hash of the normalized claim, so repeated claims
+skip the LLM call. Each language has its own namespace because verdicts
+are written in the language of the claim.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict
+from typing import Optional
+from app.config import settings
+from app.models import FactCheckResponse
+from app.myth_index import normalize_claim
+from app.services.state_store import state_store
+
+logger = logging.getLogger(__name__)
+
+
+def claim_hash(text: str) -> str:
+    """Stable hash of the normalized claim"""
+    return hashlib.sha1(normalize_claim(text).encode("utf-8")).hexdigest()
+
+
+class VerdictCache:
+    """Cache of fact-check verdicts shared by all workers"""
+
+    async def get(self, claim: str, language: str = "en") -> Optional[FactCheckResponse]:
+        """
+        Look up a cached verdict
+
+        Args:
+            claim: The claim as sent by the user
+            language: Language code of the claim
+
+        Returns:
+            Optional[FactCheckResponse]: Cached verdict, or None on a miss
+        """
+        try:
+            cached = await state_store.get(f"verdict:{language}:{claim_hash(claim)}")
+        except Exception as e:
+            logger.error(f"Error reading verdict cache: {e}")
+            return None
+        if cached is None:
+            return None
+        return FactCheckResponse(**json.loads(cached))
+
+    async def set(self, claim: str, response: FactCheckResponse, language: str = "en") -> None:
+        """
+        Store a verdict
+
+        Args:
+            claim: The claim as sent by the user
+            response: The completed fact-check
+            language: Language code of the claim
+        """
+        try:
+            await state_store.set(
+                f"verdict:{language}:{claim_hash(claim)}", json.dumps(asdict(response)), settings.verdict_cache_ttl
+            )
+        except Exception as e:
+            logger.error(f"Error writing verdict cache: {e}")
+
+
+# Global cache instance
+verdict_cache = VerdictCache()
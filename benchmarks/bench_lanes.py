@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Lane scheduling benchmark on the local mock pipeline
+
+Floods the LLM lane with fresh claims from a few heavy senders while other
+senders send greetings, then reports greeting latency, how each claim was
+answered (verdict, degraded, or acknowledged and answered later), time to
+the final reply, and the per-lane queue-wait / service-time breakdown from
+/webhook/status once every claim has its final reply. Greetings should stay
+in the low milliseconds no matter how deep the LLM queue gets.
+
+Usage:
+    python benchmarks/bench_lanes.py [--claims 200] [--greetings 50]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_SENDERS = 4
+
+OUTCOMES = [
+    ("ack", "Checking this claim now"),
+    ("degraded", "couldn't get to yours in time"),
+    ("shed", "couldn't get to your fact-check in time"),
+    ("verdict", "Fact-Check Result"),
+]
+
+
+def outcome(text: str) -> str:
+    return next((name for name, marker in OUTCOMES if marker in text), "other")
+
+
+def configure(latency_ms: int, state_dir: str) -> None:
+    """Point the app at the mock pipeline before it is imported"""
+    os.environ.update(
+        TWILIO_ACCOUNT_SID="ACbenchmark",
+        TWILIO_AUTH_TOKEN="benchmark",
+        TWILIO_PHONE_NUMBER="whatsapp:+10000000000",
+        LLM_PROVIDER="mock",
+        MOCK_LLM_LATENCY_MS=str(latency_ms),
+        TWILIO_DRY_RUN="true",
+        STATE_BACKEND="sqlite",
+        STATE_DB_PATH=os.path.join(state_dir, "state.db"),
+        RATE_LIMIT_PER_MINUTE="1000000",
+        LOG_LEVEL="WARNING",
+    )
+    sys.path.insert(0, ROOT)
+
+
+async def run(claims: int, greetings: int) -> None:
+    import logging
+    import httpx
+    from app.main import app
+    from app.services.twilio_service import twilio_service
+
+    logging.disable(logging.INFO)
+    transport = httpx.ASGITransport(app=app)
+    replies = []  # (time, outcome) of every message sent to a claim sender
+    original_send = twilio_service.send_message
+
+    async def recording_send(to: str, message: str) -> bool:
+        if to.startswith("whatsapp:+1555"):
+            replies.append((time.perf_counter(), outcome(message)))
+        return await original_send(to, message)
+
+    twilio_service.send_message = recording_send
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300) as client:
+        async def post(sid: str, sender: str, body: str) -> float:
+            started = time.perf_counter()
+            response = await client.post("/webhook/whatsapp", data={
+                "MessageSid": sid, "AccountSid": "ACbenchmark", "From": f"whatsapp:{sender}",
+                "To": "whatsapp:+10000000000", "Body": body,
+            })
+            response.raise_for_status()
+            return time.perf_counter() - started
+
+        started = time.perf_counter()
+        claim_tasks = [
+            asyncio.create_task(post(f"SMclaim{i}", f"+1555000000{i % HEAVY_SENDERS}", f"Scientists say {i} glasses of water daily prevent cancer"))
+            for i in range(claims)
+        ]
+        await asyncio.sleep(0.05)  # Let the LLM lane saturate first
+        greeting_latencies = []
+        for i in range(greetings):
+            greeting_latencies.append(await post(f"SMgreet{i}", f"+1666{i:07d}", "Hello there"))
+            await asyncio.sleep(0.01)
+        claim_latencies = await asyncio.gather(*claim_tasks)
+        # Acknowledged claims get their verdict as a follow-up message
+        while sum(name != "ack" for _, name in replies) < claims:
+            await asyncio.sleep(0.05)
+        status = (await client.get("/webhook/status")).json()
+
+    greeting_latencies.sort()
+    claim_latencies = sorted(claim_latencies)
+    print(f"greeting p50 {greeting_latencies[len(greeting_latencies) // 2] * 1000:8.2f} ms   "
+          f"max {greeting_latencies[-1] * 1000:8.2f} ms")
+    print(f"claim    p50 {claim_latencies[len(claim_latencies) // 2] * 1000:8.2f} ms   "
+          f"max {claim_latencies[-1] * 1000:8.2f} ms   (first reply)")
+    final = sorted(at - started for at, name in replies if name != "ack")
+    print(f"claim    p50 {final[len(final) // 2] * 1000:8.2f} ms   "
+          f"max {final[-1] * 1000:8.2f} ms   (final reply, from the start of the flood)")
+    # Every claim gets one final reply, preceded by an acknowledgement if it was deferred
+    final_outcomes = Counter(name for _, name in replies if name != "ack")
+    acks = sum(name == "ack" for _, name in replies)
+    print(f"claim outcomes: {dict(final_outcomes)} ({acks} acknowledged first and answered later)")
+    print(json.dumps(status["lanes"], indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--claims", type=int, default=200)
+    parser.add_argument("--greetings", type=int, default=50)
+    parser.add_argument("--latency-ms", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        configure(args.latency_ms, state_dir)
+        asyncio.run(run(args.claims, args.greetings))
+
+
+if __name__ == "__main__":
+    main()
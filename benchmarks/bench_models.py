@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Hot-path model micro-benchmark: allocations and CPU per message
+
+Compares the per-message model work before and after validating once at
+the edge:
+
+  models   before: WhatsAppMessage, FactCheckRequest, FactCheckResponse
+                   and BotResponse as Pydantic models, all validated
+           after:  WhatsAppMessage.model_validate() once, the rest are
+                   slotted dataclasses (app.models)
+  webhook  before: 10 FastAPI Form parameters, then WhatsAppMessage(...)
+           after:  request.form() validated straight into WhatsAppMessage
+
+Allocations are measured with tracemalloc (median peak bytes allocated
+during one message), CPU with time.process_time over many iterations.
+
+Usage:
+    python benchmarks/bench_models.py [--iterations 20000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Optional
+
+from pydantic import BaseModel
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import BotResponse, FactCheckRequest, FactCheckResponse, WhatsAppMessage
+
+FORM = {
+    "MessageSid": "SM0123456789abcdef0123456789abcdef",
+    "AccountSid": "AC0123456789abcdef0123456789abcdef",
+    "From": "whatsapp:+15550000001",
+    "To": "whatsapp:+10000000000",
+    "Body": "Scientists say 8 glasses of water daily prevent cancer",
+    "NumMedia": "0",
+    "ProfileName": "Bench",
+    "WaId": "15550000001",
+}
+VERDICT = "🔍 *Fact-Check Result:*\n\nFALSE: no evidence supports this claim."
+
+
+# The internal models as they were before, validated on every construction
+class PydanticFactCheckRequest(BaseModel):
+    message: str
+    sender: str
+    message_id: str
+    timestamp: datetime = datetime.now()
+
+
+class PydanticFactCheckResponse(BaseModel):
+    original_message: str
+    fact_check_result: str
+    confidence_score: Optional[float] = None
+    sources: Optional[list] = None
+    is_safe_to_process: bool = True
+
+
+class PydanticBotResponse(BaseModel):
+    to: str
+    message: str
+    message_type: str = "text"
+
+
+def models_before() -> None:
+    message = WhatsAppMessage(**FORM)
+    request = PydanticFactCheckRequest(message=message.Body, sender=message.sender_number, message_id=message.MessageSid)
+    result = PydanticFactCheckResponse(original_message=request.message, fact_check_result=VERDICT,
+                                       confidence_score=0.8, sources=[], is_safe_to_process=True)
+    PydanticBotResponse(to=message.From, message=result.fact_check_result, message_type="text")
+
+
+def models_after() -> None:
+    message = WhatsAppMessage.model_validate(FORM)
+    request = FactCheckRequest(message=message.Body, sender=message.sender_number, message_id=message.MessageSid)
+    result = FactCheckResponse(original_message=request.message, fact_check_result=VERDICT,
+                               confidence_score=0.8, sources=[], is_safe_to_process=True)
+    BotResponse(to=message.From, message=result.fact_check_result, message_type="text")
+
+
+def build_webhook_apps():
+    """Two minimal apps with the old and new webhook signatures"""
+    from fastapi import FastAPI, Form, Request
+    from fastapi.responses import PlainTextResponse
+
+    before = FastAPI()
+
+    @before.post("/whatsapp")
+    async def form_params(
+        MessageSid: str = Form(...), AccountSid: str = Form(...), From: str = Form(...),
+        To: str = Form(...), Body: str = Form(...), NumMedia: Optional[str] = Form("0"),
+        MediaUrl0: Optional[str] = Form(None), MediaContentType0: Optional[str] = Form(None),
+        ProfileName: Optional[str] = Form(None), WaId: Optional[str] = Form(None)
+    ):
+        WhatsAppMessage(MessageSid=MessageSid, AccountSid=AccountSid, From=From, To=To, Body=Body,
+                        NumMedia=NumMedia, MediaUrl0=MediaUrl0, MediaContentType0=MediaContentType0,
+                        ProfileName=ProfileName, WaId=WaId)
+        return PlainTextResponse("")
+
+    after = FastAPI()
+
+    @after.post("/whatsapp")
+    async def validate_once(request: Request):
+        WhatsAppMessage.model_validate(dict(await request.form()))
+        return PlainTextResponse("")
+
+    return before, after
+
+
+def measure(func: Callable[[], None], iterations: int) -> dict:
+    """CPU microseconds and peak allocated bytes per call"""
+    for _ in range(min(iterations, 1000)):
+        func()
+
+    start = time.process_time()
+    for _ in range(iterations):
+        func()
+    cpu = time.process_time() - start
+
+    # Memory allocated during one call, above what was live before it.
+    # tracemalloc slows everything down, so sample fewer calls
+    peaks = []
+    tracemalloc.start()
+    for _ in range(max(1, iterations // 20)):
+        tracemalloc.reset_peak()
+        live, _ = tracemalloc.get_traced_memory()
+        func()
+        peaks.append(tracemalloc.get_traced_memory()[1] - live)
+    tracemalloc.stop()
+
+    return {"cpu_us": cpu / iterations * 1e6, "peak_bytes": sorted(peaks)[len(peaks) // 2]}
+
+
+def report(label: str, before: dict, after: dict) -> None:
+    print(f"\n[{label}]")
+    print(f"  {'':8} {'CPU/msg':>10} {'peak bytes/msg':>15}")
+    for name, result in (("before", before), ("after", after)):
+        print(f"  {name:8} {result['cpu_us']:8.1f} µs {result['peak_bytes']:15,d}")
+    print(f"  speedup  {before['cpu_us'] / after['cpu_us']:8.2f}x  "
+          f"{before['peak_bytes'] / max(1, after['peak_bytes']):13.2f}x less peak memory")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000, help="Iterations of the model benchmark")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests for the webhook benchmark")
+    args = parser.parse_args()
+
+    report("models", measure(models_before, args.iterations), measure(models_after, args.iterations))
+
+    import httpx
+    before_app, after_app = build_webhook_apps()
+    loop = asyncio.new_event_loop()
+
+    def poster(app):
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+        def post() -> None:
+            response = loop.run_until_complete(client.post("/whatsapp", data=FORM))
+            assert response.status_code == 200, response.text
+        return post
+
+    report("webhook", measure(poster(before_app), args.requests), measure(poster(after_app), args.requests))
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
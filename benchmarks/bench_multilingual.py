@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Multilingual fast-path benchmark: language ID accuracy and per-message cost
+
+Runs a labelled mixed-language corpus (English, Spanish, Hindi, Urdu,
+romanized Hindi/Urdu, code-switched and mixed-script messages) through:
+
+  - the language identifier: accuracy per language, confusions, and CPU
+    microseconds per message
+  - routing (greeting / thanks / help / claim), comparing the previous
+    English-only substring keyword lists with the per-language word-level
+    classifiers, and counting replies sent in the user's language
+
+The corpus is held out from the identifier's training data (data/langid.jsonl).
+
+Usage:
+    python benchmarks/bench_multilingual.py [--corpus benchmarks/multilingual_corpus.jsonl]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+os.environ.setdefault("TWILIO_ACCOUNT_SID", "ACbenchmark")
+os.environ.setdefault("TWILIO_AUTH_TOKEN", "benchmark")
+os.environ.setdefault("TWILIO_PHONE_NUMBER", "whatsapp:+10000000000")
+os.environ.setdefault("LLM_PROVIDER", "mock")
+os.environ.setdefault("STATE_BACKEND", "memory")
+logging.disable(logging.WARNING)
+
+from app.services.fact_check_service import fact_check_service
+from app.services.localization import LOCALES, language_identifier
+from app.services.message_service import message_service
+
+
+# The English-only classifiers as they were before, with substring matching
+def old_is_fact_checkable(message: str) -> bool:
+    message_lower = message.lower()
+    fact_indicators = [
+        "is", "are", "was", "were", "will", "can", "cannot", "causes", "prevents",
+        "study shows", "research", "scientists", "doctors", "experts", "proven",
+        "fact", "true", "false", "according to", "statistics", "data"
+    ]
+    personal_indicators = [
+        "how are you", "what's up", "hello", "hi", "hey", "thanks", "thank you",
+        "good morning", "good evening", "good night", "love you", "miss you"
+    ]
+    if any(indicator in message_lower for indicator in personal_indicators):
+        return False
+    if any(indicator in message_lower for indicator in fact_indicators):
+        return True
+    return len(message.strip()) > 20
+
+
+def old_route(message: str) -> str:
+    if old_is_fact_checkable(message):
+        return "claim"
+    message_lower = message.lower()
+    if any(greeting in message_lower for greeting in ["hello", "hi", "hey", "good morning", "good evening"]):
+        return "greeting"
+    if any(thanks in message_lower for thanks in ["thank", "thanks"]):
+        return "thanks"
+    if any(help_word in message_lower for help_word in ["help", "how", "what can you do"]):
+        return "help"
+    return "default"
+
+
+REPLY_KINDS = {"greeting_reply": "greeting", "thanks_reply": "thanks", "help_reply": "help", "default_reply": "default"}
+
+
+def new_route(message: str, language: str):
+    """Route and reply language of the current pipeline"""
+    if fact_check_service.is_fact_checkable(message, language):
+        return "claim", language
+    reply = message_service._generate_conversational_response(message, language)
+    for locale in LOCALES.values():
+        for field, kind in REPLY_KINDS.items():
+            if reply == getattr(locale, field):
+                return kind, locale.code
+    return "default", language
+
+
+def cost_us(func, corpus, repeat: int) -> float:
+    start = time.process_time()
+    for _ in range(repeat):
+        for row in corpus:
+            func(row["text"])
+    return (time.process_time() - start) / (repeat * len(corpus)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default="benchmarks/multilingual_corpus.jsonl")
+    parser.add_argument("--repeat", type=int, default=200, help="Passes over the corpus for timing")
+    parser.add_argument("--show-errors", action="store_true")
+    args = parser.parse_args()
+
+    with open(args.corpus, encoding="utf-8") as f:
+        corpus = [json.loads(line) for line in f if line.strip()]
+
+    # Language ID accuracy
+    per_language = defaultdict(Counter)
+    errors = []
+    for row in corpus:
+        detected = language_identifier.detect(row["text"])
+        per_language[row["lang"]][detected] += 1
+        if detected != row["lang"]:
+            errors.append(f"  language: expected {row['lang']}, got {detected}: {row['text']}")
+
+    correct = sum(counts[language] for language, counts in per_language.items())
+    print(f"{len(corpus)} messages, {len(per_language)} languages\n")
+    print(f"[language ID] accuracy {correct / len(corpus):.1%}")
+    for language, counts in sorted(per_language.items()):
+        total = sum(counts.values())
+        confusions = ", ".join(f"{other} {n}" for other, n in counts.items() if other != language)
+        print(f"  {language:8} {counts[language] / total:6.1%}  ({total} messages){'  confused with: ' + confusions if confusions else ''}")
+
+    # Routing
+    old_correct = new_correct = in_language = 0
+    for row in corpus:
+        if old_route(row["text"]) == row["kind"]:
+            old_correct += 1
+        kind, reply_language = new_route(row["text"], language_identifier.detect(row["text"]))
+        if kind == row["kind"]:
+            new_correct += 1
+        else:
+            errors.append(f"  route: expected {row['kind']}, got {kind}: {row['text']}")
+        # Fact-check prompts ask for the detected language; canned replies are localized
+        if reply_language == row["lang"]:
+            in_language += 1
+    print("\n[routing] greeting / thanks / help / claim")
+    print(f"  English-only substring lists  {old_correct / len(corpus):6.1%}  (replies always in English)")
+    print(f"  per-language classifiers      {new_correct / len(corpus):6.1%}  ({in_language / len(corpus):.1%} answered in the user's language)")
+
+    # Per-message cost
+    print(f"\n[cost per message] (CPU, mean over {args.repeat} passes)")
+    print(f"  language ID                      {cost_us(language_identifier.detect, corpus, args.repeat):7.1f} µs")
+    print(f"  language ID + claim classifier   "
+          f"{cost_us(lambda text: fact_check_service.is_fact_checkable(text, language_identifier.detect(text)), corpus, args.repeat):7.1f} µs")
+    print(f"  old English-only classifier      {cost_us(old_is_fact_checkable, corpus, args.repeat):7.1f} µs")
+    by_language = defaultdict(list)
+    for row in corpus:
+        by_language[row["lang"]].append(row)
+    for language, rows in sorted(by_language.items()):
+        print(f"  language ID, {language:8}            {cost_us(language_identifier.detect, rows, args.repeat):7.1f} µs")
+
+    if args.show_errors and errors:
+        print("\n[errors]")
+        print("\n".join(errors))
+
+
+if __name__ == "__main__":
+    main()
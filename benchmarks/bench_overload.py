@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Overload benchmark: adaptive LLM concurrency vs. a static limit
+
+Drives the in-process app with an open-loop stream of fresh claims against
+the mock LLM provider. The provider has limited capacity (latency grows
+once more calls are in flight than it can serve) and random latency spikes.
+Each mode runs in its own process and reports time to first reply (a
+verdict, myth match or "checking" acknowledgement), time to verdict, how
+each message was answered, and the adaptive limit over time.
+
+Usage:
+    python benchmarks/bench_overload.py [--rate 30] [--seconds 15]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+OUTCOMES = [
+    ("ack", "Checking this claim now"),
+    ("myth", "looks like the well-known claim"),
+    ("degraded", "couldn't get to yours in time"),
+    ("shed", "couldn't get to your fact-check in time"),
+    ("verdict", "Fact-Check Result"),
+]
+
+NEAR_MYTHS = [
+    "Is it true that vaccines cause autism in kids",
+    "I heard the 5G network is spreading covid",
+    "Someone told me climate change is just a hoax",
+]
+
+
+def percentile(samples, p):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int((len(ordered) - 1) * p / 100))]
+
+
+async def run(rate: float, seconds: float) -> dict:
+    import logging
+    import httpx
+    from app.main import app
+    from app.services.concurrency import llm_limiter
+    from app.services.scheduler import scheduler
+    from app.services.twilio_service import twilio_service
+
+    logging.disable(logging.WARNING)
+    sent = {}  # recipient -> [(time, text)]
+    original_send = twilio_service.send_message
+
+    async def recording_send(to: str, message: str) -> bool:
+        sent.setdefault(to, []).append((time.perf_counter(), message))
+        return await original_send(to, message)
+
+    twilio_service.send_message = recording_send
+    started_at = {}
+    limits = []
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=600) as client:
+        async def post(i: int) -> None:
+            sender = f"whatsapp:+1555{i:07d}"
+            body = NEAR_MYTHS[i % len(NEAR_MYTHS)] if i % 10 == 0 else f"Scientists say {i} glasses of water daily prevent cancer"
+            started_at[sender] = time.perf_counter()
+            await client.post("/webhook/whatsapp", data={
+                "MessageSid": f"SM{i}", "AccountSid": "ACbenchmark", "From": sender,
+                "To": "whatsapp:+10000000000", "Body": body,
+            })
+
+        tasks = []
+        begin = time.perf_counter()
+        i = 0
+        while time.perf_counter() - begin < seconds:
+            tasks.append(asyncio.create_task(post(i)))
+            i += 1
+            if i % int(rate / 2 or 1) == 0:
+                limits.append(llm_limiter.limit)
+            await asyncio.sleep(1 / rate)
+        await asyncio.gather(*tasks)
+        # Wait for deferred answers
+        while any(len(messages) == 1 and "Checking this claim now" in messages[0][1] for messages in sent.values()):
+            await asyncio.sleep(0.1)
+
+    first_reply, verdict = [], []
+    outcomes = {name: 0 for name, _ in OUTCOMES}
+    for sender, messages in sent.items():
+        first_reply.append(messages[0][0] - started_at[sender])
+        final_time, final_text = messages[-1]
+        verdict.append(final_time - started_at[sender])
+        for name, marker in OUTCOMES:
+            if marker in messages[0][1]:
+                outcomes[name] += 1
+                break
+        if len(messages) > 1:
+            for name, marker in OUTCOMES[2:]:
+                if marker in final_text:
+                    outcomes[f"deferred_{name}"] = outcomes.get(f"deferred_{name}", 0) + 1
+                    break
+
+    return {
+        "messages": len(started_at),
+        "first_reply_p50_ms": percentile(first_reply, 50) * 1000,
+        "first_reply_p99_ms": percentile(first_reply, 99) * 1000,
+        "final_reply_p50_ms": percentile(verdict, 50) * 1000,
+        "final_reply_p99_ms": percentile(verdict, 99) * 1000,
+        "llm_service_time": scheduler.stats()["llm"]["service_time"],
+        "outcomes": outcomes,
+        "limit_timeline": limits,
+    }
+
+
+def child(args) -> None:
+    with tempfile.TemporaryDirectory() as state_dir:
+        os.environ.update(
+            TWILIO_ACCOUNT_SID="ACbenchmark",
+            TWILIO_AUTH_TOKEN="benchmark",
+            TWILIO_PHONE_NUMBER="whatsapp:+10000000000",
+            LLM_PROVIDER="mock",
+            MOCK_LLM_LATENCY_MS=str(args.latency_ms),
+            MOCK_LLM_SPIKE_PROBABILITY=str(args.spike_probability),
+            MOCK_LLM_SPIKE_MS=str(args.spike_ms),
+            MOCK_LLM_CAPACITY=str(args.capacity),
+            LLM_ADAPTIVE_CONCURRENCY="true" if args.mode == "adaptive" else "false",
+            LLM_MAX_CONCURRENCY=str(args.max_concurrency),
+            LLM_DEADLINE_SECONDS=str(args.deadline),
+            LLM_DEFER_QUEUE_DEPTH=str(args.defer_depth),
+            DEFERRED_DEADLINE_SECONDS=str(args.deadline),
+            TWILIO_DRY_RUN="true",
+            STATE_BACKEND="memory",
+            STATE_DB_PATH=os.path.join(state_dir, "state.db"),
+            RATE_LIMIT_PER_MINUTE="1000000",
+        )
+        sys.path.insert(0, ROOT)
+        print(json.dumps(asyncio.run(run(args.rate, args.seconds))))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=float, default=30.0, help="Messages per second")
+    parser.add_argument("--seconds", type=float, default=15.0)
+    parser.add_argument("--latency-ms", type=int, default=200)
+    parser.add_argument("--capacity", type=int, default=4, help="Mock provider capacity")
+    parser.add_argument("--spike-probability", type=float, default=0.05)
+    parser.add_argument("--spike-ms", type=int, default=2000)
+    parser.add_argument("--max-concurrency", type=int, default=16)
+    parser.add_argument("--deadline", type=float, default=5.0, help="Queue deadline for fact-checks")
+    parser.add_argument("--defer-depth", type=int, default=16, help="LLM queue depth beyond which fact-checks are deferred")
+    parser.add_argument("--mode", choices=["adaptive", "static"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        child(args)
+        return
+
+    print(f"{args.rate:.0f} msg/s for {args.seconds:.0f}s, mock LLM {args.latency_ms} ms, "
+          f"capacity {args.capacity}, {args.spike_probability:.0%} spikes of +{args.spike_ms} ms, "
+          f"deadline {args.deadline:g}s, defer past {args.defer_depth} queued")
+    for mode in ("static", "adaptive"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode] + sys.argv[1:],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"\n[{mode}] {result['messages']} messages")
+        print(f"  first reply  p50 {result['first_reply_p50_ms']:8.0f} ms   p99 {result['first_reply_p99_ms']:8.0f} ms")
+        print(f"  final reply  p50 {result['final_reply_p50_ms']:8.0f} ms   p99 {result['final_reply_p99_ms']:8.0f} ms")
+        service = result["llm_service_time"]
+        print(f"  LLM call     p50 {service['p50_ms']:8.0f} ms   p99 {service['p99_ms']:8.0f} ms")
+        print(f"  outcomes     {result['outcomes']}")
+        print(f"  limit        {result['limit_timeline']}")
+
+
+if __name__ == "__main__":
+    main()
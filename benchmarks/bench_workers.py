@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for multi-worker mode on the local mock pipeline
+
+Starts the app with 1, 2 and 4 uvicorn workers (mock LLM, Twilio dry run,
+shared SQLite state) and fires distinct claims at the webhook so every
+request reaches the LLM stage. Deferral and the queue deadline are turned
+off, so each webhook request returns only after its verdict, not after a
+"checking" acknowledgement. The LLM lane outcomes (verdicts, degraded,
+shed) are summed over the workers' /webhook/status to confirm it.
+
+The mock LLM call runs on each worker's LLM thread pool, off the event
+loop, and the LLM lane gets a static limit at least as high as the client
+concurrency. Per-worker LLM slots are then not the bottleneck, and the
+speedup reflects the CPU work per request (parsing, routing, state store)
+spread over more processes. It cannot exceed the number of CPUs.
+
+Usage:
+    python benchmarks/bench_workers.py [--workers 1 2 4] [--requests 200] [--latency-ms 50]
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def start_server(workers: int, port: int, state_dir: str, latency_ms: int, llm_concurrency: int) -> subprocess.Popen:
+    """Launch uvicorn with the mock pipeline"""
+    env = dict(
+        os.environ,
+        TWILIO_ACCOUNT_SID="ACbenchmark",
+        TWILIO_AUTH_TOKEN="benchmark",
+        TWILIO_PHONE_NUMBER="whatsapp:+10000000000",
+        LLM_PROVIDER="mock",
+        MOCK_LLM_LATENCY_MS=str(latency_ms),
+        TWILIO_DRY_RUN="true",
+        STATE_BACKEND="sqlite",
+        STATE_DB_PATH=os.path.join(state_dir, f"state-{workers}.db"),
+        RATE_LIMIT_PER_MINUTE="1000000",
+        # Time the verdict: never acknowledge-and-defer, never degrade
+        LLM_DEFER_QUEUE_DEPTH="1000000",
+        LLM_DEADLINE_SECONDS="600",
+        LLM_ADAPTIVE_CONCURRENCY="false",
+        LLM_MAX_CONCURRENCY=str(llm_concurrency),
+    )
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_healthy(base_url: str, timeout: float = 30.0) -> None:
+    """Poll /health until the server answers"""
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(f"{base_url}/health")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("Server did not become healthy")
+
+
+async def run_load(base_url: str, total: int, concurrency: int) -> float:
+    """Send total webhook requests and return requests per second"""
+    semaphore = asyncio.Semaphore(concurrency)
+    run_id = uuid.uuid4().hex[:8]
+
+    async def one(client: httpx.AsyncClient, i: int) -> None:
+        form = {
+            "MessageSid": f"SM{run_id}{i}",
+            "AccountSid": "ACbenchmark",
+            "From": f"whatsapp:+1555{i:07d}",
+            "To": "whatsapp:+10000000000",
+            "Body": f"Scientists say {run_id} {i} glasses of water daily prevent cancer",
+        }
+        async with semaphore:
+            response = await client.post(f"{base_url}/webhook/whatsapp", data=form)
+            response.raise_for_status()
+
+    async with httpx.AsyncClient(timeout=120) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(one(client, i) for i in range(total)))
+        return total / (time.perf_counter() - started)
+
+
+async def lane_outcomes(base_url: str, workers: int, attempts: int = 500) -> dict:
+    """Sum the LLM lane outcome counters of every worker"""
+    seen = {}
+    for _ in range(attempts):
+        # A fresh connection per request, so the kernel hands it to any worker
+        async with httpx.AsyncClient() as client:
+            status = (await client.get(f"{base_url}/webhook/status")).json()
+        seen[status["worker_pid"]] = status["lanes"]["llm"]
+        if len(seen) == workers:
+            break
+    outcomes = {"verdict": 0, "degraded": 0, "shed": 0, "workers_seen": len(seen)}
+    for lane in seen.values():
+        outcomes["verdict"] += lane["completed"]
+        outcomes["degraded"] += lane["degraded"]
+        outcomes["shed"] += lane["dropped"]
+    return outcomes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--latency-ms", type=int, default=50)
+    parser.add_argument("--llm-concurrency", type=int, help="Static LLM lane limit per worker (default: --concurrency)")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    llm_concurrency = args.llm_concurrency or args.concurrency
+    print(f"Mock LLM latency: {args.latency_ms} ms, {args.requests} requests, concurrency {args.concurrency}, "
+          f"LLM lane limit {llm_concurrency} per worker, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'req/s':>10} {'speedup':>8}  outcomes (including warm-up)")
+    baseline = None
+    with tempfile.TemporaryDirectory() as state_dir:
+        for workers in args.workers:
+            server = start_server(workers, args.port, state_dir, args.latency_ms, llm_concurrency)
+            try:
+                base_url = f"http://127.0.0.1:{args.port}"
+                asyncio.run(wait_healthy(base_url))
+                asyncio.run(run_load(base_url, min(20, args.requests), args.concurrency))  # warm-up
+                throughput = asyncio.run(run_load(base_url, args.requests, args.concurrency))
+                outcomes = asyncio.run(lane_outcomes(base_url, workers))
+            finally:
+                server.terminate()
+                server.wait()
+            baseline = baseline or throughput
+            print(f"{workers:>8} {throughput:>10.1f} {throughput / baseline:>7.2f}x  {outcomes}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+"""
+Shared pytest setup: configure the app for local, offline tests before it is imported
+"""
+
+import os
+
+os.environ.setdefault("TWILIO_ACCOUNT_SID", "ACtest")
+os.environ.setdefault("TWILIO_AUTH_TOKEN", "test")
+os.environ.setdefault("TWILIO_PHONE_NUMBER", "whatsapp:+10000000000")
+os.environ.setdefault("LLM_PROVIDER", "mock")
+os.environ.setdefault("TWILIO_DRY_RUN", "true")
+os.environ.setdefault("STATE_BACKEND", "memory")
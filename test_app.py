@@ -16,9 +16,24 @@ def test_project_structure():
         'app/models.py',
         'app/routes/__init__.py',
         'app/routes/webhook.py',
+        'app/routes/admin.py',
         'app/services/__init__.py',
         'app/services/twilio_service.py',
         'app/services/message_service.py',
+        'app/services/fact_check_service.py',
+        'app/services/state_store.py',
+        'app/services/verdict_cache.py',
+        'app/services/mock_llm.py',
+        'app/services/scheduler.py',
+        'app/services/concurrency.py',
+        'app/services/tracing.py',
+        'app/services/profiler.py',
+        'app/services/myth_kb.py',
+        'app/myth_index.py',
+        'app/language_id.py',
+        'app/services/localization.py',
+        'data/myths.jsonl',
+        'data/langid.jsonl',
         'requirements.txt',
         'Dockerfile',
         '.env.example',
@@ -0,0 +1,91 @@
+"""
+Tests for the AIMD concurrency limiter, fed synthetic latencies
+"""
+
+import pytest
+from app.services.concurrency import AdaptiveConcurrencyLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_additive_increase_while_healthy(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2, max_limit=4, window=4, clock=clock)
+    for _ in range(3):
+        limiter.record(0.1)
+    assert limiter.limit == 3  # About one slot per round of `limit` healthy calls
+    for _ in range(20):
+        limiter.record(0.1)
+    assert limiter.limit == 4  # Capped at max_limit
+
+
+def test_baseline_drifts_only_at_the_floor(clock):
+    floor = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2, max_limit=2, clock=clock)
+    above = AdaptiveConcurrencyLimiter(initial_limit=4, min_limit=2, max_limit=8, clock=clock)
+    for limiter in (floor, above):
+        limiter.record(0.1)
+        limiter.record(0.2)
+    assert floor.baseline == pytest.approx(0.1 + 0.01 * 0.1)
+    assert above.baseline == 0.1
+
+    # A faster call lowers the baseline at once, at the floor or not
+    above.record(0.05)
+    assert above.baseline == 0.05
+
+
+def test_one_decrease_per_round_trip_and_samples_cleared(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=2, max_limit=8, window=4, clock=clock)
+    limiter.record(0.1)
+    limiter.record(0.5)  # Median of two samples is 0.5, above 2 x the 0.1 baseline
+    assert limiter.limit == 6
+    assert len(limiter.recent) == 0
+
+    # The rest of the slow round trip does not cut the limit again
+    limiter.record(0.5)
+    limiter.record(0.5)
+    limiter.record(0.5)
+    assert limiter.limit == 6
+    assert len(limiter.recent) == 3
+
+    # One round trip (the recent median) later it may
+    clock.now += 0.5
+    limiter.record(0.5)
+    assert limiter.limit == 4
+    assert len(limiter.recent) == 0
+
+
+def test_isolated_spike_does_not_decrease(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=2, max_limit=8, window=4, clock=clock)
+    for latency in (0.1, 0.1, 0.1, 2.0):
+        limiter.record(latency)
+    assert limiter.limit == 8
+
+
+def test_failure_decreases_but_not_below_min(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=3, min_limit=2, max_limit=8, clock=clock)
+    limiter.record(1.0, success=False)
+    assert limiter.limit == 2
+    clock.now += 10
+    limiter.record(1.0, success=False)
+    assert limiter.limit == 2
+
+
+def test_disabled_limiter_stays_at_max(clock):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2, max_limit=8, window=4, enabled=False, clock=clock)
+    assert limiter.limit == 8
+    for latency in (0.1, 5.0, 5.0, 5.0):
+        limiter.record(latency)
+    limiter.record(5.0, success=False)
+    assert limiter.limit == 8
+    assert limiter.baseline is None and not limiter.recent
+    assert limiter.snapshot()["enabled"] is False
@@ -0,0 +1,90 @@
+"""
+Tests for language detection and the per-language keyword matching
+"""
+
+import asyncio
+import pytest
+from app.language_id import LanguageIdentifier
+from app.myth_index import normalize_claim
+from app.services.localization import LOCALES, contains_any, detect_language
+
+
+@pytest.mark.parametrize("text", [
+    "Tomatoes are vegetables",
+    "Nostradamus predicted covid",
+    "Obama is Kenyan",
+    "Einstein failed math",
+    "Fish feel no pain",
+    "Imran Khan is in jail",
+    "Vaccines cause autism",
+    "hi bot",
+])
+def test_short_english_claims_stay_english(text):
+    assert detect_language(text) == "en"
+
+
+@pytest.mark.parametrize("text, language", [
+    ("Las vacunas causan autismo", "es"),
+    ("¡Hola!", "es"),
+    ("Necesito ayuda", "es"),
+    ("kya yeh sach hai?", "hi-Latn"),
+    ("namaskar", "hi-Latn"),
+    ("Bill Gates vaccine mein microchip daal raha hai", "hi-Latn"),
+    ("क्या टीकों से ऑटिज़्म होता है?", "hi"),
+    ("کیا ویکسین سے آٹزم ہوتا ہے؟", "ur"),
+    ("🙏🙏", "en"),
+    ("12345", "en"),
+])
+def test_detect_language(text, language):
+    assert detect_language(text) == language
+
+
+def test_detect_language_without_model_is_default():
+    assert LanguageIdentifier().detect("Las vacunas causan autismo") == "en"
+    assert LanguageIdentifier().detect("नमस्ते") == "hi"
+
+
+def test_margin_keeps_near_ties_on_the_default():
+    # "a" has two features (the word and its one trigram), each 1.0 likelier as "es"
+    tables = {"en": ({" a ": -2.0}, -10.0), "es": ({" a ": -1.0}, -10.0)}
+    assert LanguageIdentifier(tables, margin_per_word=2.5).detect("a") == "en"
+    assert LanguageIdentifier(tables, margin_per_word=2.0).detect("a") == "es"
+
+
+def test_contains_any_matches_whole_words_and_phrases():
+    greetings = LOCALES["en"].greetings
+    assert contains_any(normalize_claim("Hi there!"), greetings)
+    assert contains_any(normalize_claim("well, good morning"), greetings)
+    assert not contains_any(normalize_claim("this is a claim"), greetings)
+    assert not contains_any(normalize_claim("good mornings"), greetings)
+    assert not contains_any("", greetings)
+
+
+def test_contains_any_uses_normalized_keywords():
+    spanish = LOCALES["es"]
+    assert contains_any(normalize_claim("¿Qué tal?"), spanish.greetings)
+    assert contains_any(normalize_claim("GRACIAS!!"), spanish.thanks)
+    assert contains_any(normalize_claim("आपका बहुत धन्यवाद"), LOCALES["hi"].thanks)
+
+
+def test_every_locale_has_system_replies():
+    for locale in LOCALES.values():
+        for field in ("rate_limit_reply", "deferred_reply", "overloaded_reply", "shed_reply", "error_reply"):
+            assert getattr(locale, field), (locale.code, field)
+        assert "BODY" in locale.media_reply.format(body="BODY")
+
+
+def test_system_replies_follow_the_message_language(monkeypatch):
+    from app.models import WhatsAppMessage
+    from app.services.message_service import message_service
+
+    async def limited(sender: str) -> bool:
+        return True
+
+    monkeypatch.setattr(message_service, "is_rate_limited", limited)
+    message = WhatsAppMessage(MessageSid="SMlocale", AccountSid="ACtest", From="whatsapp:+15550000002",
+                              To="whatsapp:+10000000000", Body="क्या टीकों से ऑटिज़्म होता है?")
+    response = asyncio.run(message_service.process_incoming_message(message))
+    assert response.message == LOCALES["hi"].rate_limit_reply
+    overloaded = message_service._overloaded_fact_check_response(message, "ur")
+    assert overloaded.fact_check_result == LOCALES["ur"].overloaded_reply
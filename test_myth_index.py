@@ -0,0 +1,97 @@
+"""
+Tests for the myth index: exact, alias, fuzzy, negated and numeric lookups
+"""
+
+import json
+import pytest
+from app.myth_index import MythIndex, compile_index, negation_mask, normalize_claim, number_hash
+
+MYTHS = [
+    {"claim": "Vaccines cause autism", "aliases": ["Autism is caused by vaccines"],
+     "verdict": "FALSE", "explanation": "No link was found.", "sources": ["WHO"]},
+    {"claim": "The Earth is flat", "aliases": ["Earth is flat"],
+     "verdict": "FALSE", "explanation": "The Earth is round.", "sources": ["NASA"]},
+    {"claim": "Climate change is a hoax", "aliases": ["Climate change is not real"],
+     "verdict": "FALSE", "explanation": "The evidence is overwhelming.", "sources": ["IPCC"]},
+    {"claim": "We only use 10 percent of our brain", "aliases": ["Humans only use 10% of their brains"],
+     "verdict": "FALSE", "explanation": "All of the brain is active.", "sources": ["NIH"]},
+    {"claim": "Drinking 8 glasses of water daily is necessary", "aliases": [],
+     "verdict": "PARTIALLY TRUE", "explanation": "Needs vary.", "sources": ["Mayo Clinic"]},
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    source = tmp_path / "myths.jsonl"
+    source.write_text("\n".join(json.dumps(myth) for myth in MYTHS), encoding="utf-8")
+    path = tmp_path / "myths.idx"
+    assert compile_index(str(source), str(path)) == len(MYTHS)
+    index = MythIndex(str(path))
+    yield index
+    index.close()
+
+
+def test_exact_lookup(index):
+    assert len(index) == len(MYTHS)
+    assert index.lookup("vaccines CAUSE autism!")["claim"] == "Vaccines cause autism"
+    assert index.lookup("Vaccines cause asthma") is None
+
+
+def test_alias_lookup_returns_canonical_claim(index):
+    assert index.lookup("Autism is caused by vaccines")["claim"] == "Vaccines cause autism"
+    assert index.lookup("Climate change is not real")["claim"] == "Climate change is a hoax"
+
+
+def test_fuzzy_lookup(index):
+    record, score = index.similar("The earth is flat!!", 0.8)
+    assert record["claim"] == "The Earth is flat"
+    assert score == 1.0
+    record, score = index.similar("Vaccines really cause autism", 0.8)
+    assert record["claim"] == "Vaccines cause autism"
+    assert 0.8 <= score < 1.0
+    assert index.similar("Bananas are berries", 0.8) is None
+
+
+@pytest.mark.parametrize("claim", [
+    "Vaccines do not cause autism",
+    "Vaccines don't cause autism",
+    "Vaccines never cause autism",
+    "The Earth is not flat",
+    "Climate change is not a hoax",
+    "Climate change is real",
+])
+def test_fuzzy_lookup_rejects_negation_mismatch(index, claim):
+    """A claim that negates a myth (or drops the myth's negation) is not that myth"""
+    assert index.similar(claim, 0.5) is None
+
+
+@pytest.mark.parametrize("claim", [
+    "Humans use 100% of their brain",
+    "Drinking 2 glasses of water daily is necessary",
+    "Drinking glasses of water daily is necessary",
+])
+def test_fuzzy_lookup_rejects_number_mismatch(index, claim):
+    """A claim about a different quantity is not the myth"""
+    assert index.similar(claim, 0.5) is None
+
+
+def test_fuzzy_lookup_keeps_matching_numbers(index):
+    record, _ = index.similar("Humans only use 10% of their brain", 0.8)
+    assert record["claim"] == "We only use 10 percent of our brain"
+
+
+def test_fuzzy_lookup_keeps_matching_negation(index):
+    record, _ = index.similar("Climate change is not real at all", 0.8)
+    assert record["claim"] == "Climate change is a hoax"
+
+
+def test_negation_mask():
+    assert negation_mask(normalize_claim("The Earth is flat")) == 0
+    assert negation_mask(normalize_claim("It isn't flat")) == negation_mask("it is not flat")
+    assert negation_mask("never") != negation_mask("not")
+
+
+def test_number_hash():
+    assert number_hash(normalize_claim("The Earth is flat")) == 0
+    assert number_hash(normalize_claim("10% of 2 brains")) == number_hash("2 brains 10 percent")
+    assert number_hash("10 percent") != number_hash("100 percent")
@@ -0,0 +1,112 @@
+"""
+Tests for the lane scheduler: fair queueing, deadlines and abandoned work
+"""
+
+import asyncio
+import pytest
+from app.services.scheduler import DeadlineExceeded, LaneScheduler
+
+
+def make_scheduler(limit: int = 1) -> LaneScheduler:
+    return LaneScheduler({"test": limit})
+
+
+async def hold(gate: asyncio.Event) -> str:
+    await gate.wait()
+    return "held"
+
+
+def test_deficit_round_robin_interleaves_senders():
+    """A light sender's jobs are not queued behind a heavy sender's backlog"""
+    async def scenario():
+        scheduler = make_scheduler()
+        order = []
+
+        def job(sender):
+            async def work():
+                order.append(sender)
+                await asyncio.sleep(0)
+            return work
+
+        tasks = [asyncio.create_task(scheduler.submit("test", "heavy", job("heavy"))) for _ in range(6)]
+        await asyncio.sleep(0)  # The heavy backlog is queued first
+        tasks += [asyncio.create_task(scheduler.submit("test", "light", job("light"))) for _ in range(2)]
+        await asyncio.gather(*tasks)
+        return order
+
+    order = asyncio.run(scenario())
+    assert order.count("heavy") == 6 and order.count("light") == 2
+    # Served alternately once both senders have queued work
+    assert order[:5] == ["heavy", "heavy", "light", "heavy", "light"]
+
+
+def test_degrade_after_deadline():
+    """Work still queued at its deadline gets the fallback and never runs"""
+    async def scenario():
+        scheduler = make_scheduler()
+        gate = asyncio.Event()
+        ran = []
+        blocker = asyncio.create_task(scheduler.submit("test", "a", lambda: hold(gate)))
+        await asyncio.sleep(0)
+        result = await scheduler.submit(
+            "test", "b", lambda: ran.append("b"), deadline=0.05, degrade=lambda: "fallback"
+        )
+        gate.set()
+        await blocker
+        await asyncio.sleep(0)
+        return result, ran, scheduler.stats()["test"]
+
+    result, ran, stats = asyncio.run(scenario())
+    assert result == "fallback"
+    assert ran == []  # The abandoned job was skipped, not run late
+    assert stats["degraded"] == 1 and stats["queued"] == 0
+
+
+def test_deadline_exceeded_without_degrade():
+    async def scenario():
+        scheduler = make_scheduler()
+        gate = asyncio.Event()
+        blocker = asyncio.create_task(scheduler.submit("test", "a", lambda: hold(gate)))
+        await asyncio.sleep(0)
+        try:
+            with pytest.raises(DeadlineExceeded):
+                await scheduler.submit("test", "b", lambda: "late", deadline=0.05)
+        finally:
+            gate.set()
+            await blocker
+        return scheduler.stats()["test"]
+
+    stats = asyncio.run(scenario())
+    assert stats["dropped"] == 1
+
+
+def test_started_job_is_not_cancelled_by_deadline():
+    """The deadline only covers queue wait; running work is delivered"""
+    async def scenario():
+        scheduler = make_scheduler()
+
+        async def slow():
+            await asyncio.sleep(0.1)
+            return "done"
+
+        result = await scheduler.submit("test", "a", slow, deadline=0.01, degrade=lambda: "fallback")
+        return result, scheduler.stats()["test"]
+
+    result, stats = asyncio.run(scenario())
+    assert result == "done"
+    assert stats["degraded"] == 0 and stats["completed"] == 1
+
+
+def test_is_saturated_and_queue_depth():
+    async def scenario():
+        scheduler = make_scheduler()
+        gate = asyncio.Event()
+        assert not scheduler.is_saturated("test")
+        jobs = [asyncio.create_task(scheduler.submit("test", sender, lambda: hold(gate))) for sender in "abc"]
+        await asyncio.sleep(0)
+        busy = scheduler.is_saturated("test"), scheduler.queue_depth("test")
+        gate.set()
+        await asyncio.gather(*jobs)
+        return busy, (scheduler.is_saturated("test"), scheduler.queue_depth("test"))
+
+    assert asyncio.run(scenario()) == ((True, 2), (False, 0))
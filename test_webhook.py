@@ -0,0 +1,69 @@
+"""
+Tests for the WhatsApp webhook's form validation and the internal models
+"""
+
+import time
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models import FactCheckRequest
+from app.services.twilio_service import twilio_service
+
+FORM = {
+    "MessageSid": "SMtest0001",
+    "AccountSid": "ACtest",
+    "From": "whatsapp:+15550000001",
+    "To": "whatsapp:+10000000000",
+    "Body": "Hello",
+}
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    messages = []
+
+    async def record(to: str, message: str) -> bool:
+        messages.append((to, message))
+        return True
+
+    monkeypatch.setattr(twilio_service, "send_message", record)
+    return messages
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_valid_form_is_processed(client, sent):
+    response = client.post("/webhook/whatsapp", data={**FORM, "MessageSid": f"SM{time.time_ns()}"})
+    assert response.status_code == 200
+    assert len(sent) == 1
+    assert sent[0][0] == FORM["From"]
+    assert sent[0][1]
+
+
+def test_missing_field_is_422_with_body_location(client, sent):
+    form = {key: value for key, value in FORM.items() if key != "MessageSid"}
+    response = client.post("/webhook/whatsapp", data=form)
+    assert response.status_code == 422
+    errors = response.json()["detail"]
+    assert [error["loc"] for error in errors] == [["body", "MessageSid"]]
+    assert errors[0]["type"] == "missing"
+    assert errors[0]["input"] is None
+    assert not sent
+
+
+def test_non_form_body_is_422(client, sent):
+    response = client.post("/webhook/whatsapp", json=FORM)
+    assert response.status_code == 422
+    assert {tuple(error["loc"]) for error in response.json()["detail"]} >= {("body", "MessageSid"), ("body", "Body")}
+    assert not sent
+
+
+def test_fact_check_request_timestamp_is_per_instance():
+    first = FactCheckRequest(message="claim", sender="+1", message_id="SM1")
+    time.sleep(0.001)
+    second = FactCheckRequest(message="claim", sender="+1", message_id="SM2")
+    assert first.timestamp != second.timestamp
+    assert second.timestamp > first.timestamp